@@ -0,0 +1,152 @@
+"""Headless self-play arena between two strategies.
+
+Example
+----------
+python arena.py min-max random --games 100 --jobs 4 --output results.jsonl
+python arena.py min-max min-max-matrix --games 40 --time-limit 0.2 --opening-plies 8
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import json
+import math
+import random
+import sys
+import time
+
+from othello import OthelloGame
+from strategy import Strategy
+from strategy.strategy import REGISTRY
+
+
+def play_game(strategy_A:str, strategy_B:str, index:int, seed:int, time_limit=None, opening_plies=0):
+    """Play one game. Colors alternate with index, and A is black in even games.
+    The first opening_plies moves are random and shared by each pair of games.
+
+    Returns
+    ----------
+    result : dict
+        Disk differential and per-move times seen from A.
+    """
+    random.seed(seed + index)
+    A_is_black = index%2 == 0
+    game = OthelloGame(player_color="black")
+    game.load_strategy(Strategy)
+    game.change_strategy(strategy_A if A_is_black else strategy_B, True, time_limit)
+    game.change_strategy(strategy_B if A_is_black else strategy_A, False, time_limit)
+
+    move_times = {"A": [], "B": []}
+    opening = random.Random(seed + index//2)
+    plies = 0
+    game.reversible_area()
+    while True:
+        if game.turn_playable() and plies < opening_plies:
+            row, column = opening.choice(sorted(game.reversible.keys()))
+            plies += 1
+            game.reverse(row, column)
+            game.count_pass = 0
+        elif game.turn_playable():
+            is_black = game._game_turn == game._player_color
+            side = "A" if is_black == A_is_black else "B"
+            Strategy_ = game._Strategy_player if is_black else game._Strategy_CPU
+            start = time.perf_counter()
+            row, column = Strategy_.selecter(game)
+            move_times[side].append(time.perf_counter() - start)
+            game.reverse(row, column)
+            game.count_pass = 0
+        else:
+            game.count_pass += 1
+        game.change_turn()
+        if game.game_judgement():
+            break
+
+    difference = game.count_player - game.count_CPU
+    if not A_is_black:
+        difference *= -1
+    return {
+        "game": index,
+        "seed": seed + index,
+        "A_color": "black" if A_is_black else "white",
+        "difference": int(difference),
+        "result": "win" if difference > 0 else "loss" if difference < 0 else "draw",
+        "move_times": move_times,
+    }
+
+
+def elo_difference(score:float):
+    """Elo difference of A over B estimated from the mean score, or None if unbounded."""
+    if score <= 0.0 or score >= 1.0:
+        return None
+    return -400*math.log10(1/score - 1)
+
+
+def summarize(strategy_A:str, strategy_B:str, results:list):
+    """Return tallies, mean disk differential, Elo estimate and mean move times."""
+    tally = {"win": 0, "draw": 0, "loss": 0}
+    for result in results:
+        tally[result["result"]] += 1
+    games = len(results)
+    score = (tally["win"] + tally["draw"]/2)/games if games else 0.0
+
+    mean_times = {}
+    for side in ("A", "B"):
+        times = [elapsed for result in results for elapsed in result["move_times"][side]]
+        mean_times[side] = sum(times)/len(times) if times else 0.0
+    return {
+        "summary": True,
+        "A": strategy_A,
+        "B": strategy_B,
+        "games": games,
+        "win": tally["win"],
+        "draw": tally["draw"],
+        "loss": tally["loss"],
+        "mean_difference": sum(result["difference"] for result in results)/games if games else 0.0,
+        "elo": elo_difference(score),
+        "mean_move_time": mean_times,
+    }
+
+
+def run(strategy_A:str, strategy_B:str, games:int, jobs=1, seed=0, time_limit=None, output=None, opening_plies=0):
+    """Play games in parallel and stream each result to output as JSON lines.
+
+    Returns
+    ----------
+    summary : dict
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(play_game, strategy_A, strategy_B, index, seed, time_limit, opening_plies) for index in range(games)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if output is not None:
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+
+    summary = summarize(strategy_A, strategy_B, sorted(results, key=lambda result: result["game"]))
+    if output is not None:
+        output.write(json.dumps(summary) + "\n")
+        output.flush()
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("strategy_A", choices=tuple(REGISTRY))
+    parser.add_argument("strategy_B", choices=tuple(REGISTRY))
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=1, help="number of processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=None, help="time budget per move of min-max")
+    parser.add_argument("--opening-plies", type=int, default=0, help="random moves at the start of each pair of games")
+    parser.add_argument("--output", default=None, help="JSONL file of results (default: stdout)")
+    args = parser.parse_args()
+
+    if args.output is None:
+        summary = run(args.strategy_A, args.strategy_B, args.games, args.jobs, args.seed, args.time_limit, sys.stdout, args.opening_plies)
+    else:
+        with open(args.output, "w") as output:
+            summary = run(args.strategy_A, args.strategy_B, args.games, args.jobs, args.seed, args.time_limit, output, args.opening_plies)
+        print(json.dumps(summary))
@@ -0,0 +1,4 @@
+"""Benchmarks and verification scripts.
+
+Run them from the repository root, e.g. ``python -m benchmark.verify_bitboard``.
+"""
@@ -0,0 +1,127 @@
+"""Compare node counts of the alpha-beta search with the previous min-max search.
+"""
+
+import argparse
+import time
+
+from strategy.minmax import Minmax
+from strategy.transposition import EXACT
+
+from .positions import random_position
+
+
+class LegacyMinmax(Minmax):
+    """Minmax with the single-bound search used before negamax alpha-beta."""
+
+    def game_judgement(self, count_player:int, count_CPU:int, count_blank:int):
+        """Judgement of game. Passes were never counted inside the search."""
+        if count_blank == 0:
+            if count_player == count_CPU:
+                self._result = "DRAW"
+            if count_player > count_CPU:
+                self._result = "WIN"
+            if count_player < count_CPU:
+                self._result = "LOSE"
+            return True
+        return False
+
+    def min_max(self, board, game_turn, depth, key, pre_evaluation=-1*float('inf')):
+        """Search of the previous implementation, seen from the root player."""
+        self._nodes += 1
+
+        # If the board is known, return value.
+        is_exist, evaluation, selected = self._table.lookup(key, depth, -1*float('inf'), float('inf'))
+        if is_exist:
+            return evaluation, selected
+
+        # Calculate evaluation.
+        evaluation = self.evaluate_value(board, self._player_color)
+        if depth == 0:
+            self._table.store(key, depth, EXACT, evaluation, (1,1))
+            return evaluation, (1,1)
+
+        if game_turn == self._player_color:
+            max_evaluation = -1*float('inf')
+        else:
+            min_evaluation = float('inf')
+
+        reversible = self.reversible_area(board, game_turn)
+        if self.turn_playable(reversible):
+            for (row, column) in reversible.keys():
+                self.make_move(board, reversible, row, column, game_turn)
+                new_key = self._zobrist.update(key, row, column, reversible[(row, column)], game_turn)
+                if self.game_judgement(*self.count_disks(board, game_turn)):
+                    if self._result == 'WIN':
+                        next_evaluation = 10**10
+                    elif self._result == 'LOSE':
+                        next_evaluation = -10**10
+                    else:
+                        next_evaluation = 0
+                else:
+                    if game_turn == self._player_color:
+                        next_evaluation = self.min_max(board, game_turn*-1, depth-1, new_key, max_evaluation)[0]
+                    else:
+                        next_evaluation = self.min_max(board, game_turn*-1, depth-1, new_key, min_evaluation)[0]
+                self.unmake_move(board)
+
+                # alpha-bata method(pruning)
+                if game_turn == self._player_color:
+                    if next_evaluation < pre_evaluation:
+                        return next_evaluation, (row, column)
+                else:
+                    if pre_evaluation < next_evaluation:
+                        return next_evaluation, (row, column)
+                    pass
+
+                if game_turn == self._player_color:
+                    if max_evaluation < next_evaluation:
+                        max_evaluation = next_evaluation
+                        selected = (row, column)
+                else:
+                    if next_evaluation < min_evaluation:
+                        min_evaluation = next_evaluation
+                        selected = (row, column)
+        else:
+            return self.min_max(board, game_turn*-1, depth-1, key ^ self._zobrist.TURN)
+        if game_turn == self._player_color:
+            self._table.store(key, depth, EXACT, max_evaluation, selected)
+            return max_evaluation, selected
+        else:
+            self._table.store(key, depth, EXACT, min_evaluation, selected)
+            return min_evaluation, selected
+
+
+def fixed_positions():
+    """Opening, midgame and late midgame positions."""
+    return [random_position(seed, plies) for plies in (8, 20, 32) for seed in range(2)]
+
+
+def count_nodes(strategy, game, depth:int):
+    start = time.perf_counter()
+    selected = strategy.put_disk(game, depth)
+    return strategy.statistics["search"]["nodes"], time.perf_counter() - start, selected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depths", type=int, nargs="+", default=[5, 6, 7, 8, 9])
+    parser.add_argument("--skip-legacy", action="store_true", help="measure only the current search")
+    args = parser.parse_args()
+
+    print("{:>5} {:>8} {:>12} {:>12} {:>8} {:>10} {:>10}".format(
+        "depth", "position", "legacy", "negamax", "ratio", "legacy[s]", "negamax[s]"))
+    for depth in args.depths:
+        total_legacy = 0
+        total_current = 0
+        for index, game in enumerate(fixed_positions()):
+            current, current_time, _ = count_nodes(Minmax(), game, depth)
+            if args.skip_legacy:
+                legacy, legacy_time = 0, 0.0
+            else:
+                legacy, legacy_time, _ = count_nodes(LegacyMinmax(), game, depth)
+            total_legacy += legacy
+            total_current += current
+            print("{:>5} {:>8} {:>12} {:>12} {:>8.2f} {:>10.2f} {:>10.2f}".format(
+                depth, index, legacy, current, legacy/current, legacy_time, current_time))
+        print("{:>5} {:>8} {:>12} {:>12} {:>8.2f}".format(
+            depth, "total", total_legacy, total_current, total_legacy/total_current))
@@ -0,0 +1,76 @@
+"""Compare batched legal-move generation with calling the per-board functions in a loop.
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+import bitboard
+from othello import OthelloGame
+
+
+def collect_positions(count:int, seed=0):
+    """Return stacked padded boards and sides to move seen in random games."""
+    rand = random.Random(seed)
+    boards, game_turns = [], []
+    while len(boards) < count:
+        game = OthelloGame(player_color="black")
+        count_pass = 0
+        while count_pass < 2 and len(boards) < count:
+            reversible = game.reversible_area()
+            boards.append(game.board.copy())
+            game_turns.append(game._game_turn)
+            if reversible:
+                game.reverse(*rand.choice(list(reversible.keys())))
+                count_pass = 0
+            else:
+                count_pass += 1
+            game._game_turn *= -1
+    return np.array(boards), np.array(game_turns)
+
+
+def loop_reversible(boards, game_turns):
+    moves = []
+    flips = []
+    for board, game_turn in zip(boards, game_turns):
+        player = bitboard.from_array(board, game_turn)
+        opponent = bitboard.from_array(board, -game_turn)
+        legal = bitboard.legal_moves(player, opponent)
+        moves.append(legal)
+        flips.append({bit: bitboard.flip_mask(player, opponent, bit) for bit in bitboard.iterate_bits(legal)})
+    return moves, flips
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=10000)
+    args = parser.parse_args()
+
+    boards, game_turns = collect_positions(args.boards)
+
+    start = time.perf_counter()
+    expected_moves, expected_flips = loop_reversible(boards, game_turns)
+    loop_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    moves, flips = bitboard.batch_reversible(boards, game_turns)
+    batch_elapsed = time.perf_counter() - start
+
+    for index in range(len(boards)):
+        assert int(moves[index]) == expected_moves[index], index
+        for bit in range(bitboard.BOARD_SIZE*bitboard.BOARD_SIZE):
+            assert int(flips[index, bit]) == expected_flips[index].get(bit, 0), (index, bit)
+
+    # The same boards given as (black, white) bitboards.
+    bitboards = np.array([[bitboard.from_array(board, bitboard.BLACK), bitboard.from_array(board, bitboard.WHITE)] for board in boards], dtype=np.uint64)
+    start = time.perf_counter()
+    bitboard_moves, bitboard_flips = bitboard.batch_reversible(bitboards, game_turns)
+    bitboard_elapsed = time.perf_counter() - start
+    assert (bitboard_moves == moves).all() and (bitboard_flips == flips).all()
+
+    print("{} boards verified".format(len(boards)))
+    print("loop : {:>10.0f} boards/s".format(len(boards)/loop_elapsed))
+    print("batch: {:>10.0f} boards/s (padded boards)".format(len(boards)/batch_elapsed))
+    print("batch: {:>10.0f} boards/s (bitboards)".format(len(boards)/bitboard_elapsed))
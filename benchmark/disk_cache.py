@@ -0,0 +1,50 @@
+"""Check the on-disk transposition cache and measure nodes saved by a warm cache.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from strategy.cache import DiskCache
+from strategy.minmax import Minmax
+
+from .positions import standard_positions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--positions", type=int, default=8)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "cache.bin")
+    positions = standard_positions(args.positions)
+
+    # Cold run fills the cache.
+    writer = Minmax(book=None, endgame_empties=None, cache=path)
+    cold = []
+    for game in positions:
+        selected = writer.put_disk(game, args.depth)
+        writer.update_file()
+        cold.append((selected, writer.statistics["search"]["nodes"]))
+    writer.close()
+    print("file: {} bytes".format(os.path.getsize(path)))
+
+    # Warm run reads it read-only through a fresh table.
+    start = time.perf_counter()
+    reader = Minmax(book=None, endgame_empties=None, cache=path, cache_readonly=True)
+    print("startup: {:.4f} s".format(time.perf_counter() - start))
+    print("{:>8} {:>10} {:>10} {:>8}".format("position", "cold", "warm", "same"))
+    for index, game in enumerate(positions):
+        selected = reader.put_disk(game, args.depth)
+        print("{:>8} {:>10} {:>10} {:>8}".format(
+            index, cold[index][1], reader.statistics["search"]["nodes"], str(selected == cold[index][0])))
+    reader.close()
+
+    # A damaged header is detected and the file is ignored by readers.
+    with open(path, "r+b") as file_:
+        file_.seek(10)
+        file_.write(b"\xff")
+    damaged = DiskCache(path, readonly=True)
+    print("damaged header detected: {}, slots: {}".format(damaged.corrupted, len(damaged)))
@@ -0,0 +1,27 @@
+"""Measure solve time and node count of the endgame solver by number of empties.
+"""
+
+import argparse
+
+from strategy.endgame import EndgameSolver
+
+from .positions import random_position
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--empties", type=int, nargs="+", default=[8, 10, 12, 14])
+    parser.add_argument("--positions", type=int, default=4)
+    parser.add_argument("--wld", action="store_true", help="search only win, loss or draw")
+    parser.add_argument("--parity", choices=("region", "quadrant"), default="quadrant")
+    args = parser.parse_args()
+
+    print("{:>7} {:>8} {:>10} {:>10} {:>10} {:>8}".format("empties", "position", "evaluation", "nodes", "time[s]", "move"))
+    for empties in args.empties:
+        for seed in range(args.positions):
+            game = random_position(seed, 60 - empties)
+            solver = EndgameSolver(exact=not args.wld, parity=args.parity)
+            evaluation, selected = solver.solve(game.board, game._game_turn)
+            statistics = solver.statistics
+            print("{:>7} {:>8} {:>10} {:>10} {:>10.3f} {:>8}".format(
+                statistics["empties"], seed, evaluation, statistics["nodes"], statistics["elapsed"], str(selected)))
@@ -0,0 +1,36 @@
+"""Compare the pattern evaluation with the static matrices: speed and strength at equal time.
+"""
+
+import argparse
+import time
+
+import arena
+from strategy.minmax import Minmax
+
+from .positions import standard_positions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--time-limit", type=float, default=0.1)
+    parser.add_argument("--opening-plies", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    positions = standard_positions(8)
+    for evaluation in ("matrix", "pattern"):
+        minmax = Minmax(evaluation=evaluation)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for game in positions:
+                minmax.evaluate_value(game.board, game._game_turn)
+        elapsed = time.perf_counter() - start
+        print("{:>8}: {:.0f} evaluations/s".format(evaluation, args.repeat*len(positions)/elapsed))
+
+    summary = arena.run(
+        "min-max", "min-max-matrix", args.games, args.jobs, time_limit=args.time_limit,
+        opening_plies=args.opening_plies,
+    )
+    print("pattern vs matrix: +{win} ={draw} -{loss}, mean difference {mean_difference:+.1f}, elo {elo}".format(**summary))
@@ -0,0 +1,115 @@
+"""Check the shared features against the array implementations and time the heuristic strategies.
+
+Each position is given to all four strategies, which share one Features of it.
+"""
+
+import argparse
+from collections import deque
+import random
+import time
+
+from bitboard import FULL, iterate_bits, popcount
+from othello import OthelloGame
+from strategy.evenness import Evenness
+from strategy.features import RegionIndex, empty_regions, features
+from strategy.maximize import Maximize
+from strategy.minimize import Minimize
+from strategy.openness import Openness
+
+from .positions import random_position
+
+
+def array_openness(othello, candidate):
+    """Openness of a move by the former list-based loop."""
+    set_openness = []
+    for return_disk in othello.reversible[candidate]:
+        for x in (-1, 0, 1):
+            for y in (-1, 0, 1):
+                square = (return_disk[0]+x, return_disk[1]+y)
+                if othello.board[square] == OthelloGame.BLANK and square not in set_openness:
+                    set_openness.append(square)
+    return len(set_openness)
+
+
+def array_region(othello, candidate):
+    """Size of the empty region of candidate by breadth-first search."""
+    region = {candidate}
+    queue = deque([candidate])
+    while queue:
+        x, y = queue.pop()
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if othello.board[x+dx, y+dy] == OthelloGame.BLANK and (x+dx, y+dy) not in region:
+                region.add((x+dx, y+dy))
+                queue.append((x+dx, y+dy))
+    return len(region)
+
+
+def array_counts(othello):
+    """Potential mobility and frontiers of the side to move by looping over the squares.
+
+    Returns
+    ----------
+    potential_mobility, frontier, opponent_frontier
+    """
+    def next_to(square, color):
+        return any(othello.board[square[0]+x, square[1]+y] == color
+                   for x in (-1, 0, 1) for y in (-1, 0, 1) if (x, y) != (0, 0))
+
+    squares = [(row, column) for row in range(1, 9) for column in range(1, 9)]
+    player = othello._game_turn
+    potential_mobility = sum(othello.board[square] == OthelloGame.BLANK and next_to(square, -player) for square in squares)
+    frontier = sum(othello.board[square] == player and next_to(square, OthelloGame.BLANK) for square in squares)
+    opponent_frontier = sum(othello.board[square] == -player and next_to(square, OthelloGame.BLANK) for square in squares)
+    return potential_mobility, frontier, opponent_frontier
+
+
+def check_region_index(games:int, seed=0):
+    """Fill and take back random squares, and compare RegionIndex with a fresh flood fill."""
+    rand = random.Random(seed)
+    for _ in range(games):
+        empty = FULL
+        regions = RegionIndex(empty)
+        filled = []
+        for _ in range(60):
+            if filled and rand.random() < 0.3:
+                regions.unfill()
+                empty |= 1 << filled.pop()
+            else:
+                bit = rand.choice(list(iterate_bits(empty)))
+                regions.fill(bit)
+                empty ^= 1 << bit
+                filled.append(bit)
+            for region in empty_regions(empty):
+                for bit in iterate_bits(region):
+                    assert regions.region(bit) == region and regions.size(bit) == popcount(region)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=300)
+    args = parser.parse_args()
+
+    games = [random_position(seed, 10 + seed%45) for seed in range(args.positions)]
+    for game in games:
+        position = features(game)
+        assert features(game) is position and position.moves is game.reversible_area()
+        assert position.mobility == len(game.reversible)
+        assert (position.potential_mobility, position.frontier, position.opponent_frontier) == array_counts(game)
+        for candidate in position.moves:
+            assert position.openness(candidate) == array_openness(game, candidate)
+            assert position.parity(candidate) == array_region(game, candidate)%2
+    print("{} positions agree with the array implementations".format(len(games)))
+    check_region_index(100)
+    print("region index agrees with flood fill")
+
+    # Fresh positions, so that the first strategy pays for the features it reads.
+    games = [random_position(seed, 10 + seed%45) for seed in range(args.positions)]
+    strategies = [Strategy_() for Strategy_ in (Maximize, Minimize, Openness, Evenness)]
+    elapsed = [0.0]*len(strategies)
+    for game in games:
+        for index, strategy in enumerate(strategies):
+            start = time.perf_counter()
+            strategy.put_disk(game)
+            elapsed[index] += time.perf_counter() - start
+    for strategy, elapsed_ in zip(strategies, elapsed):
+        print("{:>10}: {:.3f} ms/move".format(type(strategy).__name__, elapsed_/len(games)*1000))
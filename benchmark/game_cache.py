@@ -0,0 +1,77 @@
+"""Count board scans of OthelloGame while games are played step by step.
+
+The game is driven as the GUI drives it: process_game() is polled several
+times while the background search runs, and the player clicks through
+choice_player(). With cached legal moves, each position is scanned once.
+"""
+
+import argparse
+import random
+import time
+
+from othello import OthelloGame
+from strategy import Strategy
+
+
+class CountingBackend:
+    """Board backend which counts the calls of the wrapped backend."""
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.scans = 0
+        self.counts = 0
+        return
+
+    def reversible_area(self, board, game_turn:int):
+        self.scans += 1
+        return self._backend.reversible_area(board, game_turn)
+
+    def count_disks(self, board, player_color:int):
+        self.counts += 1
+        return self._backend.count_disks(board, player_color)
+
+
+def play(seed:int, polls:int):
+    """Play one game of random strategies.
+
+    Returns
+    ----------
+    backend, number of positions, elapsed seconds
+    """
+    random.seed(seed)
+    game = OthelloGame(player_color="black")
+    game.load_strategy(Strategy)
+    game._Strategy_player.set_strategy("random")
+    backend = CountingBackend(game._backend)
+    game._backend = backend
+    positions = 0
+    start = time.perf_counter()
+    while not game.result:
+        turn, version = game._game_turn, game.board_version
+        for _ in range(polls):
+            game.process_game()
+            if (game._game_turn, game.board_version) != (turn, version):
+                break
+        else:
+            # The player's turn: click the move of the player's strategy.
+            game.choice_player(*game._Strategy_player.selecter(game))
+        positions += 1
+    return backend, positions, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--polls", type=int, default=5, help="process_game calls per position")
+    args = parser.parse_args()
+
+    scans = counts = positions = 0
+    elapsed = 0.0
+    for seed in range(args.games):
+        backend, positions_, elapsed_ = play(seed, args.polls)
+        scans += backend.scans
+        counts += backend.counts
+        positions += positions_
+        elapsed += elapsed_
+    print("{} positions: {:.2f} scans and {:.2f} counts per position, {:.3f} ms per position".format(
+        positions, scans/positions, counts/positions, elapsed/positions*1000))
@@ -0,0 +1,63 @@
+"""Check the incremental evaluation against the full one and measure evaluations per second.
+"""
+
+import argparse
+import time
+
+from strategy.minmax import Minmax
+
+from .positions import standard_positions
+
+
+class CheckedMinmax(Minmax):
+    """Minmax which compares both evaluations at every leaf."""
+
+    def evaluate_value(self, board, game_turn:int):
+        evaluation = super().evaluate_value(board, game_turn)
+        if self._incremental.board is board:
+            self._incremental.board = None
+            expected = super().evaluate_value(board, game_turn)
+            self._incremental.board = board
+            assert evaluation == expected, (evaluation, expected)
+            self.checked += 1
+        return evaluation
+
+
+def evaluations_per_second(minmax, game, repeat:int):
+    """Rate of full and incremental evaluations of positions one move after game."""
+    board = game.board.copy()
+    reversible = minmax.reversible_area(board, game._game_turn)
+    minmax.prepare_search()
+    minmax.make_move(board, reversible, *next(iter(reversible)), game._game_turn)
+    detached = board.copy()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        minmax.evaluate_value(detached, game._game_turn*-1)
+    full = repeat/(time.perf_counter() - start)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        minmax.evaluate_value(board, game._game_turn*-1)
+    incremental = repeat/(time.perf_counter() - start)
+    return full, incremental
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--positions", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5000)
+    args = parser.parse_args()
+
+    positions = standard_positions(args.positions)
+    for evaluation in ("matrix", "pattern"):
+        checked = CheckedMinmax(book=None, endgame_empties=None, evaluation=evaluation)
+        checked.checked = 0
+        for game in positions:
+            checked.put_disk(game, args.depth)
+        print("{:>8}: {} leaves equal to the full evaluation".format(evaluation, checked.checked))
+
+        minmax = Minmax(book=None, endgame_empties=None, evaluation=evaluation)
+        rates = [evaluations_per_second(minmax, game, args.repeat) for game in positions]
+        print("{:>8}: full {:.0f} evaluations/s, incremental {:.0f} evaluations/s".format(
+            evaluation, sum(rate[0] for rate in rates)/len(rates), sum(rate[1] for rate in rates)/len(rates)))
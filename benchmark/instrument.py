@@ -0,0 +1,68 @@
+"""Show the search statistics of Minmax(instrument=True) and their overhead.
+
+Each corpus position is searched with and without instrumentation.
+Both must visit the same nodes and select the same move.
+"""
+
+import argparse
+import json
+import os
+import time
+
+from strategy.minmax import Minmax
+
+from .suite import CORPUS, load_position
+
+
+def timed_search(entry:dict, depth:int, **options):
+    """Search a corpus position to depth with a fresh engine.
+
+    Returns
+    ----------
+    selected, nodes, elapsed, statistics
+    """
+    minmax = Minmax(book=None, endgame_empties=None, **options)
+    game = load_position(entry)
+    start = time.perf_counter()
+    selected = minmax.put_disk(game, depth)
+    elapsed = time.perf_counter() - start
+    minmax.close()
+    return selected, minmax._nodes, elapsed, minmax.statistics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--log", default=None, help="JSONL file of the instrumented moves")
+    parser.add_argument("--profile", default=None, help="cProfile dump of the instrumented searches")
+    args = parser.parse_args()
+
+    with open(CORPUS) as file_:
+        corpus = [entry for entry in json.load(file_) if entry["phase"] != "endgame"]
+    if args.log is not None and os.path.exists(args.log):
+        os.remove(args.log)
+
+    plain_time = instrumented_time = 0.0
+    for entry in corpus:
+        selected, nodes, elapsed, _ = timed_search(entry, args.depth)
+        plain_time += elapsed
+        selected_, nodes_, elapsed_, statistics = timed_search(
+            entry, args.depth, instrument=True, instrument_log=args.log)
+        instrumented_time += elapsed_
+        assert (selected, nodes) == (selected_, nodes_), entry["name"]
+
+        summary = statistics["instrument"]
+        print("{:>11}: nodes {:>7} ebf {:.2f} first-move cutoffs {:.2f}".format(
+            entry["name"], nodes, summary["branching_factor"], summary["first_move_cutoff_rate"]))
+        print("    nodes by ply   {}".format(summary["nodes"]))
+        print("    cutoffs by ply {}".format(summary["cutoffs"]))
+        for name, timing in summary["timings"].items():
+            print("    {:>15}: {:>7} calls {:7.1f} ms".format(name, timing["calls"], timing["seconds"]*1000))
+    print("overhead of instrumentation: {:+.1%}".format(instrumented_time/plain_time - 1))
+
+    if args.profile is not None:
+        minmax = Minmax(book=None, endgame_empties=None, profile=args.profile)
+        for entry in corpus:
+            minmax.put_disk(load_position(entry), args.depth)
+        minmax.close()
+        print("profile written to {}".format(args.profile))
@@ -0,0 +1,57 @@
+"""Compare the parallel root-split search with the serial search.
+
+Every worker count, 1 included, runs through the process pool of RootSplitter,
+so that the 1 worker row shows the overhead of the pool against the serial search.
+"""
+
+import argparse
+
+from strategy.minmax import Minmax
+from strategy.parallel import RootSplitter
+
+from .positions import standard_positions
+
+
+def search(minmax, games, depth:int):
+    """Return selected moves and the total elapsed time.
+    The table and history are cleared before each position, so that move ordering is deterministic.
+    """
+    moves = []
+    elapsed = 0.0
+    for game in games:
+        minmax._table.clear()
+        minmax._history = {}
+        moves.append(minmax.put_disk(game, depth))
+        elapsed += minmax.statistics["search"]["elapsed"]
+    return moves, elapsed
+
+
+def pooled(workers:int):
+    """Minmax searching root moves in a pool of workers processes.
+    Minmax(workers=1) searches serially, so the splitter is set here for every count.
+    Workers are built with the default options, as the searching Minmax is.
+    """
+    minmax = Minmax(endgame_empties=None)
+    minmax._splitter = RootSplitter(workers, {})
+    return minmax
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--positions", type=int, default=6)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    games = standard_positions(args.positions)
+    serial_moves, serial_elapsed = search(Minmax(endgame_empties=None), games, args.depth)
+    print("{:>7} {:>10} {:>8} {:>10}".format("workers", "time[s]", "speedup", "same move"))
+    print("{:>7} {:>10.2f} {:>8.2f} {:>10}".format("serial", serial_elapsed, 1.0, "-"))
+    for workers in args.workers:
+        minmax = pooled(workers)
+        # Start the worker processes before measuring.
+        search(minmax, games[:1], 2)
+        moves, elapsed = search(minmax, games, args.depth)
+        minmax.close()
+        print("{:>7} {:>10.2f} {:>8.2f} {:>10}".format(
+            workers, elapsed, serial_elapsed/elapsed, str(moves == serial_moves)))
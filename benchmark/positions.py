@@ -0,0 +1,34 @@
+"""Fixed positions for benchmarks.
+"""
+
+import random
+
+from othello import OthelloGame
+
+
+def random_position(seed:int, plies:int):
+    """Return an OthelloGame after plies random moves chosen with seed.
+    The side to move always has a legal move.
+    """
+    rand = random.Random(seed)
+    while True:
+        game = OthelloGame(player_color="black")
+        game.reversible_area()
+        for _ in range(plies):
+            if not game.turn_playable():
+                game.change_turn()
+            if not game.turn_playable():
+                break
+            game.reverse(*rand.choice(list(game.reversible.keys())))
+            game.change_turn()
+        if not game.turn_playable():
+            game.change_turn()
+        if game.turn_playable():
+            return game
+        seed += 1000
+        rand = random.Random(seed)
+
+
+def standard_positions(count=8, plies=20):
+    """Return the positions shared by benchmarks."""
+    return [random_position(seed, plies) for seed in range(count)]
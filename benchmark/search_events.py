@@ -0,0 +1,93 @@
+"""Check that a game driven by events keeps moving after a background search is cancelled.
+
+The event loop of the GUI is replaced by a queue: TURN and SEARCHED events
+advance the game by one step, as MyFrame does. While the CPU is searching,
+the strategy is changed, or undo or redo is called with nothing to restore.
+The CPU must still move afterwards.
+"""
+
+import argparse
+import queue
+import threading
+import time
+
+from othello import OthelloGame
+from strategy import Strategy
+
+
+class SlowEngine:
+    """Engine which thinks for seconds before the first legal move, unless cancelled."""
+
+    def __init__(self, seconds:float):
+        self._seconds = seconds
+        self._cancelled = threading.Event()
+        return
+
+    def put_disk(self, othello):
+        self._cancelled.wait(self._seconds)
+        return next(iter(othello.reversible))
+
+    def cancel(self):
+        self._cancelled.set()
+        return
+
+    def clear_cancel(self):
+        self._cancelled.clear()
+        return
+
+
+def cpu_moves(action, seconds:float, timeout:float):
+    """Start the CPU's search, call action(game) while it runs and wait for the CPU to move.
+
+    Returns
+    ----------
+    moved : bool
+        True if the CPU put a disk within timeout seconds.
+    """
+    # The CPU plays black, so it is to move from the start with an empty history.
+    game = OthelloGame(player_color="white")
+    game.load_strategy(Strategy)
+    game._Strategy_CPU._strategy = SlowEngine(seconds)
+    events = queue.Queue()
+    game.subscribe(OthelloGame.TURN, lambda game_turn: events.put(game_turn))
+    game.subscribe(OthelloGame.SEARCHED, lambda: events.put(None))
+
+    game.process_game(background=True)
+    while not game._worker.running():
+        time.sleep(0.001)
+    action(game)
+    deadline = time.perf_counter() + timeout
+    while game.board_version == 0:
+        try:
+            events.get(timeout=max(0.0, deadline - time.perf_counter()))
+        except queue.Empty:
+            return False
+        game.process_game(background=True)
+    return True
+
+
+def change_strategy(game):
+    game.change_strategy("maximize", False)
+    return
+
+
+def undo(game):
+    game.undo_turn()
+    return
+
+
+def redo(game):
+    game.redo_turn()
+    return
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=0.2, help="thinking time of the slow engine")
+    parser.add_argument("--timeout", type=float, default=3.0)
+    args = parser.parse_args()
+
+    for action in (change_strategy, undo, redo):
+        start = time.perf_counter()
+        assert cpu_moves(action, args.seconds, args.timeout), action.__name__
+        print("{:>15}: CPU moved after {:.2f} s".format(action.__name__, time.perf_counter() - start))
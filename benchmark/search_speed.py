@@ -0,0 +1,34 @@
+"""Measure nodes per second and allocations per node of the min-max search.
+
+Allocations are the memory blocks the search leaves allocated, counted by
+sys.getallocatedblocks() around it, divided by the nodes searched.
+"""
+
+import argparse
+
+from strategy.minmax import Minmax
+
+from .positions import standard_positions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--positions", type=int, default=8)
+    args = parser.parse_args()
+
+    total_nodes = 0
+    total_elapsed = 0.0
+    total_blocks = 0
+    for index, game in enumerate(standard_positions(args.positions)):
+        minmax = Minmax()
+        selected = minmax.put_disk(game, args.depth)
+        minmax.close()
+        search = minmax.statistics["search"]
+        total_nodes += search["nodes"]
+        total_elapsed += search["elapsed"]
+        total_blocks += search.get("allocated_blocks", 0)
+        print("position {}: move {} nodes {} {:.0f} nodes/s {:.3f} allocations/node".format(
+            index, selected, search["nodes"], search.get("nodes_per_second", 0.0), search.get("allocations_per_node", 0.0)))
+    print("total: nodes {} {:.0f} nodes/s {:.3f} allocations/node".format(
+        total_nodes, total_nodes/total_elapsed, total_blocks/total_nodes))
@@ -0,0 +1,71 @@
+"""Report cold-start time by module import and the time to select each strategy.
+
+Imports are measured in a fresh interpreter with -X importtime, so the
+report does not depend on what this process has already imported.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+
+def import_times(module:str):
+    """Import module in a fresh interpreter.
+
+    Returns
+    ----------
+    times : list of (cumulative microseconds, self microseconds, module name)
+        In the order reported by -X importtime.
+    error : str or None
+        The last line of the error if the import failed.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        stderr=subprocess.PIPE, universal_newlines=True,
+    )
+    times = []
+    error = None
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            error = line
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[0].strip().isdigit():
+            continue
+        times.append((int(fields[1]), int(fields[0]), fields[2].rstrip()))
+    return times, error if process.returncode else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", nargs="+", default=["game", "othello", "strategy", "arena"])
+    parser.add_argument("--top", type=int, default=8, help="number of slowest imports shown per module")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        times, error = import_times(module)
+        if error is not None:
+            print("{}: not importable here ({})".format(module, error.strip()))
+            continue
+        total = next(cumulative for cumulative, _, name in reversed(times) if name.strip() == module)
+        print("{}: {:.1f} ms".format(module, total/1000))
+        # Top-level packages of the dependency tree, by cumulative time.
+        for cumulative, _, name in sorted(times, reverse=True)[1:args.top + 1]:
+            print("    {:>8.1f} ms  {}".format(cumulative/1000, name))
+
+    from othello import OthelloGame
+    from strategy import Strategy
+    from strategy.strategy import REGISTRY
+
+    game = OthelloGame()
+    strategy = Strategy(game)
+    print("strategy selection (first, again):")
+    for name in REGISTRY:
+        start = time.perf_counter()
+        strategy.set_strategy(name)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        strategy.set_strategy(name)
+        again = time.perf_counter() - start
+        print("    {:>16}: {:8.2f} ms {:8.3f} ms".format(name, first*1000, again*1000))
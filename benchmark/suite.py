@@ -0,0 +1,201 @@
+"""Reproducible search benchmark over the checked-in position corpus.
+
+For each engine configuration and position, record node count, nodes per
+second, time to each depth, TT hit rate and the chosen move as JSON.
+With --baseline, compare with stored results and flag regressions.
+
+Example
+----------
+python -m benchmark.suite --output results.json
+python -m benchmark.suite --baseline
+python -m benchmark.suite --make-corpus
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from bitboard import BLACK, BOARD_SIZE, WHITE
+from othello import OthelloGame
+from strategy.minmax import Minmax
+
+from .positions import random_position
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus.json")
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# name: (Minmax options, searched phases, solve instead of search)
+CONFIGS = {
+    "array": ({"book": None, "endgame_empties": None}, ("opening", "midgame", "endgame"), False),
+    "bitboard": ({"backend": "bitboard", "book": None, "endgame_empties": None}, ("opening", "midgame", "endgame"), False),
+    "matrix": ({"evaluation": "matrix", "book": None, "endgame_empties": None}, ("opening", "midgame", "endgame"), False),
+    "solver": ({"book": None}, ("endgame",), True),
+}
+# (phase, plies from the start, positions)
+PHASES = (("opening", 8, 4), ("midgame", 24, 4), ("endgame", 50, 4))
+DISKS = {BLACK: "X", WHITE: "O", 0: "-"}
+
+
+def make_corpus():
+    """Positions after random plies. Each entry is a 64-character board and the side to move."""
+    corpus = []
+    for phase, plies, count in PHASES:
+        for seed in range(count):
+            game = random_position(seed, plies)
+            corpus.append({
+                "name": "{}-{}".format(phase, seed),
+                "phase": phase,
+                "board": "".join(DISKS[int(disk)] for disk in game.board[1:-1, 1:-1].ravel()),
+                "turn": "black" if game._game_turn == BLACK else "white",
+            })
+    return corpus
+
+
+def load_position(entry:dict):
+    """Return an OthelloGame of a corpus entry."""
+    game = OthelloGame(player_color="black")
+    colors = {value: key for key, value in DISKS.items()}
+    for index, disk in enumerate(entry["board"]):
+        game.board[index//BOARD_SIZE + 1, index%BOARD_SIZE + 1] = colors[disk]
+    game._game_turn = BLACK if entry["turn"] == "black" else WHITE
+    # The board was written directly, so cached moves and counts are stale.
+    game.board_version += 1
+    game.reversible_area()
+    return game
+
+
+def search(minmax, game, depth:int):
+    """Deepen from 1 to depth with one table and record the time at which each depth completes."""
+    board = game.board.copy()
+    minmax.prepare_search()
+    key = minmax._zobrist.hashing(board, game._game_turn)
+    start = time.perf_counter()
+    time_to_depth = []
+    for depth_ in range(1, depth + 1):
+        selected = minmax.min_max(board, game._game_turn, depth_, key)[1]
+        time_to_depth.append(time.perf_counter() - start)
+    return {
+        "depth": depth,
+        "nodes": minmax._nodes,
+        "time_to_depth": time_to_depth,
+        "tt_hit_rate": minmax._table.statistics()["hit_rate"],
+        "move": list(selected) if selected is not None else None,
+    }
+
+
+def solve(minmax, game):
+    """Solve the position exactly with the endgame solver of minmax."""
+    selected = minmax._endgame.solve(game.board, game._game_turn)[1]
+    statistics = minmax._endgame.statistics
+    return {
+        "depth": statistics["empties"],
+        "nodes": statistics["nodes"],
+        "time_to_depth": [statistics["elapsed"]],
+        "tt_hit_rate": statistics["table"]["hit_rate"],
+        "move": list(selected) if selected is not None else None,
+    }
+
+
+def run(corpus:list, configs:list, depth:int, repeat=3):
+    """Benchmark every configuration on its phases of the corpus.
+    Each position is measured repeat times and the fastest run is kept.
+    """
+    results = []
+    for config in configs:
+        options, phases, solves = CONFIGS[config]
+        for entry in corpus:
+            if entry["phase"] not in phases:
+                continue
+            result = None
+            for _ in range(repeat):
+                # A fresh engine for each run, so that node counts do not depend on the order.
+                minmax = Minmax(**options)
+                game = load_position(entry)
+                run_ = solve(minmax, game) if solves else search(minmax, game, depth)
+                minmax.close()
+                if result is None or run_["time_to_depth"][-1] < result["time_to_depth"][-1]:
+                    result = run_
+            elapsed = result["time_to_depth"][-1]
+            result.update({
+                "config": config,
+                "position": entry["name"],
+                "phase": entry["phase"],
+                "nodes_per_second": result["nodes"]/elapsed if elapsed else 0.0,
+            })
+            results.append(result)
+            print("{:>9} {:>11} depth {:>2} nodes {:>8} {:>9.0f} nodes/s hit {:.2f} move {}".format(
+                config, entry["name"], result["depth"], result["nodes"], result["nodes_per_second"],
+                result["tt_hit_rate"], result["move"]), file=sys.stderr)
+    return results
+
+
+def compare(results:list, baseline:list, tolerance:float):
+    """Return regressions of results against baseline.
+
+    A regression is a changed move, more nodes than the baseline,
+    or nodes per second lower by more than tolerance.
+    """
+    stored = {(result["config"], result["position"]): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = stored.get((result["config"], result["position"]))
+        if before is None:
+            continue
+        name = "{} {}".format(result["config"], result["position"])
+        if result["move"] != before["move"]:
+            regressions.append("{}: move {} -> {}".format(name, before["move"], result["move"]))
+        if result["nodes"] > before["nodes"]*(1 + tolerance):
+            regressions.append("{}: nodes {} -> {}".format(name, before["nodes"], result["nodes"]))
+        if result["nodes_per_second"] < before["nodes_per_second"]*(1 - tolerance):
+            regressions.append("{}: nodes/s {:.0f} -> {:.0f}".format(
+                name, before["nodes_per_second"], result["nodes_per_second"]))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--configs", nargs="+", choices=tuple(CONFIGS), default=list(CONFIGS))
+    parser.add_argument("--output", default=None, help="JSON file of results (default: stdout)")
+    parser.add_argument(
+        "--baseline", nargs="?", const=BASELINE, default=None,
+        help="JSON results to compare with (default: the checked-in baseline)",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative slowdown")
+    parser.add_argument("--make-corpus", action="store_true", help="write the corpus and exit")
+    args = parser.parse_args()
+
+    if args.make_corpus:
+        with open(CORPUS, "w") as file_:
+            json.dump(make_corpus(), file_, indent=1)
+        sys.exit(0)
+
+    with open(CORPUS) as file_:
+        corpus = json.load(file_)
+    report = {
+        "depth": args.depth,
+        "python": platform.python_version(),
+        "results": run(corpus, args.configs, args.depth, args.repeat),
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        with open(args.output, "w") as file_:
+            json.dump(report, file_, indent=1)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file_:
+            baseline = json.load(file_)
+        if baseline["depth"] != args.depth:
+            print("baseline was searched to depth {}, not compared".format(baseline["depth"]), file=sys.stderr)
+            sys.exit(1)
+        regressions = compare(report["results"], baseline["results"], args.tolerance)
+        for regression in regressions:
+            print("REGRESSION " + regression, file=sys.stderr)
+        print("{} regressions against {}".format(len(regressions), args.baseline), file=sys.stderr)
+        sys.exit(1 if regressions else 0)
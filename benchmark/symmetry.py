@@ -0,0 +1,111 @@
+"""Check symmetric Zobrist keys and report what canonical keys gain.
+
+Keys of the 8 transformed copies of random positions must agree on their
+canonical key, and a stored move must come back in the orientation of
+each copy. Then each corpus position and the start position are searched
+with and without symmetry, comparing evaluation, nodes and table hit rate.
+The evaluation must agree at every depth of the iterative deepening.
+"""
+
+import argparse
+import json
+import time
+
+from bitboard import (
+    BLACK, SYMMETRIES, TRANSFORM_BIT, WHITE, bit_to_square, from_array, square_to_bit, to_array, transform,
+)
+from othello import OthelloGame
+from strategy.minmax import Minmax
+from strategy.transposition import EXACT, TranspositionTable, Zobrist, canonical_key
+
+from .positions import random_position
+from .suite import CORPUS, load_position
+
+
+def transformed(board, symmetry:int):
+    """Padded board after a symmetry."""
+    return to_array(
+        transform(from_array(board, BLACK), symmetry),
+        transform(from_array(board, WHITE), symmetry),
+    )
+
+
+def check_keys(positions:int):
+    zobrist = Zobrist(symmetric=True)
+    for seed in range(positions):
+        game = random_position(seed, 4 + seed%50)
+        key = zobrist.hashing(game.board, game._game_turn)
+        selected = next(iter(game.reversible))
+        table = TranspositionTable(2**10)
+        table.store(key, 1, EXACT, 0, selected)
+        for symmetry in range(SYMMETRIES):
+            other = zobrist.hashing(transformed(game.board, symmetry), game._game_turn)
+            assert canonical_key(other)[0] == canonical_key(key)[0]
+            expected = bit_to_square(TRANSFORM_BIT[symmetry][square_to_bit(*selected)])
+            assert table.lookup(other, 1, 0, 0)[2] == expected, (seed, symmetry)
+
+        # Incremental updates agree with hashing from scratch.
+        row, column = selected
+        updated = zobrist.update(key, row, column, game.reversible[selected], game._game_turn)
+        game.reverse(row, column)
+        assert updated == zobrist.hashing(game.board, game._game_turn*-1)
+
+
+# name: symmetry_disks
+SETTINGS = {"plain": 0, "always": 64, "default": 16}
+
+
+def compare(game, depth:int):
+    """Search game with each setting of symmetry_disks.
+
+    Returns
+    ----------
+    {name: (evaluations by depth, nodes, hit rate, elapsed)}
+    """
+    results = {}
+    for name, symmetry_disks in SETTINGS.items():
+        minmax = Minmax(book=None, endgame_empties=None, symmetry_disks=symmetry_disks)
+        assert minmax.symmetric_evaluation()
+        board = game.board.copy()
+        minmax.prepare_search()
+        minmax.select_keys(board)
+        start = time.perf_counter()
+        evaluations = []
+        # Deepen as put_disk does with a time limit, so that shallower iterations fill the table.
+        for depth_ in range(1, depth + 1):
+            key = minmax._zobrist.hashing(board, game._game_turn)
+            evaluations.append(minmax.min_max(board, game._game_turn, depth_, key)[0])
+        elapsed = time.perf_counter() - start
+        results[name] = (tuple(evaluations), minmax._nodes, minmax._table.statistics()["hit_rate"], elapsed)
+        minmax.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--positions", type=int, default=200)
+    args = parser.parse_args()
+
+    check_keys(args.positions)
+    print("{} positions: keys of the 8 symmetries agree".format(args.positions))
+
+    with open(CORPUS) as file_:
+        corpus = [(entry["name"], load_position(entry)) for entry in json.load(file_)]
+    start = OthelloGame(player_color="black")
+    start.reversible_area()
+    corpus.insert(0, ("start", start))
+
+    totals = {setting: [0, 0.0] for setting in SETTINGS}
+    print("{:>11} {:>26} {:>17}".format("", "nodes", "hit rate"))
+    print("{:>11} {:>8} {:>8} {:>8} {:>8} {:>8}".format("", *SETTINGS, "plain", "always"))
+    for name, game in corpus:
+        results = compare(game, args.depth)
+        assert len({result[0] for result in results.values()}) == 1, name
+        for setting, (_, nodes, _, elapsed) in results.items():
+            totals[setting][0] += nodes
+            totals[setting][1] += elapsed
+        print("{:>11} {:>8} {:>8} {:>8} {:>8.2f} {:>8.2f}".format(
+            name, *(result[1] for result in results.values()), results["plain"][2], results["always"][2]))
+    for setting, (nodes, elapsed) in totals.items():
+        print("{:>8}: {:>7} nodes {:.2f} s".format(setting, nodes, elapsed))
@@ -0,0 +1,120 @@
+"""Verify the bitboard and array backends move-for-move against the original array loop.
+"""
+
+import argparse
+import random
+import time
+
+from bitboard import bit_to_square, flip_squares, from_array, iterate_bits, legal_moves
+from othello import OthelloGame
+from strategy.minmax import Minmax
+
+
+def loop_reversible_area(board, game_turn:int):
+    """The original array loop of reversible_area, kept as the reference."""
+    reversible = {}
+    dx = (-1, 0, 1)
+    dy = (-1, 0, 1)
+    for row in range(1, OthelloGame.BOARD_SIZE+1):
+        for column in range(1, OthelloGame.BOARD_SIZE+1):
+            if board[row, column] != 0:
+                continue
+            for x in dx:
+                for y in dy:
+                    if game_turn+board[row+x,column+y] == 0:
+                        coefficient = 2
+                        while True:
+                            if board[row+x*coefficient, column+y*coefficient] == game_turn:
+                                if (row, column) not in reversible.keys():
+                                    reversible[(row, column)] = []
+                                for coefficient_ in range(1, coefficient):
+                                    reversible[(row, column)].append((row+x*coefficient_, column+y*coefficient_))
+                                break
+                            elif board[row+x*coefficient, column+y*coefficient] == game_turn*-1:
+                                pass
+                            else:
+                                break
+                            coefficient += 1
+    return reversible
+
+
+def play_game(seed:int):
+    """Play a random game with both backends and compare every position.
+
+    Returns
+    ----------
+    plies : int
+        Number of compared positions.
+    """
+    rand = random.Random(seed)
+    array_game = OthelloGame(player_color="black", backend="array")
+    bit_game = OthelloGame(player_color="black", backend="bitboard")
+    array_minmax = Minmax(backend="array")
+    bit_minmax = Minmax(backend="bitboard")
+
+    plies = 0
+    count_pass = 0
+    while count_pass < 2:
+        expected = array_game.reversible_area()
+        actual = bit_game.reversible_area()
+        assert list(expected.items()) == list(actual.items()), (seed, plies)
+        reference = loop_reversible_area(array_game.board, array_game._game_turn)
+        assert list(expected.items()) == list(reference.items()), (seed, plies)
+        player, opponent = from_array(bit_game.board, bit_game._game_turn), from_array(bit_game.board, -bit_game._game_turn)
+        assert {bit_to_square(bit): flip_squares(player, opponent, bit)
+                for bit in iterate_bits(legal_moves(player, opponent))} == reference, (seed, plies)
+
+        game_turn = array_game._game_turn
+        assert list(array_minmax.reversible_area(array_game.board, game_turn).items()) \
+            == list(bit_minmax.reversible_area(bit_game.board, game_turn).items()), (seed, plies)
+        for color in (OthelloGame.BLACK, OthelloGame.WHITE):
+            assert tuple(array_minmax.count_disks(array_game.board, color)) \
+                == tuple(bit_minmax.count_disks(bit_game.board, color)), (seed, plies)
+
+        if expected:
+            row, column = rand.choice(list(expected.keys()))
+            array_game.reverse(row, column)
+            bit_game.reverse(row, column)
+            count_pass = 0
+        else:
+            count_pass += 1
+        array_game.change_turn()
+        bit_game.change_turn()
+        assert (array_game.count_player, array_game.count_CPU, array_game.count_blank) \
+            == (bit_game.count_player, bit_game.count_CPU, bit_game.count_blank), (seed, plies)
+        assert (array_game.board == bit_game.board).all(), (seed, plies)
+        plies += 1
+    return plies
+
+
+def measure(backend:str, games:int):
+    """Return the time per reversible_area call of a backend."""
+    rand = random.Random(0)
+    calls = 0
+    elapsed = 0.0
+    for _ in range(games):
+        game = OthelloGame(player_color="black", backend=backend)
+        count_pass = 0
+        while count_pass < 2:
+            start = time.perf_counter()
+            reversible = game.reversible_area()
+            elapsed += time.perf_counter() - start
+            calls += 1
+            if reversible:
+                game.reverse(*rand.choice(list(reversible.keys())))
+                count_pass = 0
+            else:
+                count_pass += 1
+            game._game_turn *= -1
+    return elapsed/calls
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=200)
+    args = parser.parse_args()
+
+    positions = sum(play_game(seed) for seed in range(args.games))
+    print("verified {} positions in {} games".format(positions, args.games))
+    for backend in ("array", "bitboard"):
+        print("{:>8}: {:.1f} us / reversible_area".format(backend, measure(backend, 20)*1e6))
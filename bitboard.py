@@ -0,0 +1,343 @@
+"""Bitboard backend of othello.
+
+Each side is stored as a 64-bit mask.
+Square (row, column) of the padded 10x10 board (1 <= row, column <= 8)
+corresponds to bit (row-1)*8 + (column-1).
+"""
+
+import numpy as np
+
+from rays import RAY_BITS, SQUARE_OF_BIT
+
+BLACK = 1
+WHITE = -1
+BLANK = 0
+BOARD_SIZE = 8
+
+FULL = 0xFFFFFFFFFFFFFFFF
+NOT_FIRST_COLUMN = 0xFEFEFEFEFEFEFEFE
+NOT_LAST_COLUMN = 0x7F7F7F7F7F7F7F7F
+
+# (row delta, column delta), in the same order as the array implementation.
+DIRECTIONS = tuple((x, y) for x in (-1, 0, 1) for y in (-1, 0, 1) if (x, y) != (0, 0))
+
+
+def _direction_mask(column_delta:int):
+    """Mask applied after shifting, which removes disks wrapped to the other edge."""
+    if column_delta == 1:
+        return NOT_FIRST_COLUMN
+    if column_delta == -1:
+        return NOT_LAST_COLUMN
+    return FULL
+
+# (shift, mask) for each direction.
+SHIFTS = tuple((x*BOARD_SIZE + y, _direction_mask(y)) for x, y in DIRECTIONS)
+
+
+def shift(bits:int, shift_:int, mask:int):
+    """Shift all disks by one square in a direction."""
+    if shift_ > 0:
+        return (bits << shift_) & mask
+    return (bits >> -shift_) & mask
+
+
+def neighbours(bits:int, shifts=SHIFTS):
+    """Return the mask of squares next to any disk of bits."""
+    around = 0
+    for shift_, mask in shifts:
+        around |= shift(bits, shift_, mask)
+    return around
+
+
+# (shift, mask) of the four orthogonal directions.
+ORTHOGONAL_SHIFTS = tuple(
+    (shift_, mask) for (x, y), (shift_, mask) in zip(DIRECTIONS, SHIFTS) if x == 0 or y == 0
+)
+
+
+def square_to_bit(row:int, column:int):
+    """Convert a square of the padded board to a bit index."""
+    return (row - 1)*BOARD_SIZE + (column - 1)
+
+
+def bit_to_square(bit:int):
+    """Convert a bit index to a square of the padded board."""
+    return bit//BOARD_SIZE + 1, bit%BOARD_SIZE + 1
+
+
+def popcount(bits:int):
+    """Count the number of set bits."""
+    return bin(bits).count("1")
+
+
+def iterate_bits(bits:int):
+    """Yield bit indices of set bits in ascending order."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def from_array(board, color:int):
+    """Return the mask of squares occupied by color on the padded board."""
+    occupied = np.packbits(board[1:-1, 1:-1].ravel() == color, bitorder="little")
+    return int.from_bytes(occupied.tobytes(), "little")
+
+
+def to_array(black:int, white:int):
+    """Return the padded 10x10 board built from two masks."""
+    board = np.full((BOARD_SIZE + 2, BOARD_SIZE + 2), 2, dtype=int)
+    inner = np.zeros(BOARD_SIZE*BOARD_SIZE, dtype=int)
+    for bit in iterate_bits(black):
+        inner[bit] = BLACK
+    for bit in iterate_bits(white):
+        inner[bit] = WHITE
+    board[1:-1, 1:-1] = inner.reshape(BOARD_SIZE, BOARD_SIZE)
+    return board
+
+
+def legal_moves(player:int, opponent:int):
+    """Return the mask of squares where player can put a disk."""
+    empty = ~(player | opponent) & FULL
+    moves = 0
+    for shift_, mask in SHIFTS:
+        candidate = shift(player, shift_, mask) & opponent
+        for _ in range(5):
+            candidate |= shift(candidate, shift_, mask) & opponent
+        moves |= shift(candidate, shift_, mask) & empty
+    return moves
+
+
+def flip_mask(player:int, opponent:int, bit:int):
+    """Return the mask of disks reversed by putting a disk on bit."""
+    flipped = 0
+    for shift_, mask in SHIFTS:
+        line = 0
+        cursor = shift(1 << bit, shift_, mask)
+        while cursor & opponent:
+            line |= cursor
+            cursor = shift(cursor, shift_, mask)
+        if cursor & player:
+            flipped |= line
+    return flipped
+
+
+def flip_squares(player:int, opponent:int, bit:int):
+    """Return reversed squares in the order of the array implementation."""
+    squares = []
+    for ray in RAY_BITS[bit]:
+        for length, square in enumerate(ray):
+            if not opponent >> square & 1:
+                if length and player >> square & 1:
+                    squares.extend(SQUARE_OF_BIT[reversed_] for reversed_ in ray[:length])
+                break
+    return squares
+
+
+
+# Symmetries of the board. A transform is a combination of
+# transpose (row <-> column), vertical flip (rows) and horizontal flip (columns).
+def flip_vertical(bits:int):
+    """Reverse the order of rows."""
+    return int.from_bytes(bits.to_bytes(8, "little"), "big")
+
+
+def flip_horizontal(bits:int):
+    """Reverse the order of columns."""
+    bits = ((bits >> 1) & 0x5555555555555555) | ((bits & 0x5555555555555555) << 1)
+    bits = ((bits >> 2) & 0x3333333333333333) | ((bits & 0x3333333333333333) << 2)
+    return ((bits >> 4) & 0x0F0F0F0F0F0F0F0F) | ((bits & 0x0F0F0F0F0F0F0F0F) << 4)
+
+
+def transpose(bits:int):
+    """Swap rows and columns."""
+    swapped = 0x0F0F0F0F00000000 & (bits ^ (bits << 28))
+    bits ^= swapped ^ (swapped >> 28)
+    swapped = 0x3333000033330000 & (bits ^ (bits << 14))
+    bits ^= swapped ^ (swapped >> 14)
+    swapped = 0x5500550055005500 & (bits ^ (bits << 7))
+    bits ^= swapped ^ (swapped >> 7)
+    return bits & FULL
+
+
+def transform(bits:int, symmetry:int):
+    """Apply one of the 8 symmetries, numbered by (transpose, vertical, horizontal) bits."""
+    if symmetry & 1:
+        bits = flip_horizontal(bits)
+    if symmetry & 2:
+        bits = flip_vertical(bits)
+    if symmetry & 4:
+        bits = transpose(bits)
+    return bits
+
+SYMMETRIES = 8
+# TRANSFORM_BIT[symmetry][bit] is the bit after the symmetry, INVERSE_BIT maps it back.
+TRANSFORM_BIT = tuple(
+    tuple(transform(1 << bit, symmetry).bit_length() - 1 for bit in range(BOARD_SIZE*BOARD_SIZE))
+    for symmetry in range(SYMMETRIES)
+)
+INVERSE_BIT = tuple(
+    tuple(sorted(range(BOARD_SIZE*BOARD_SIZE), key=lambda bit: table[bit]))
+    for table in TRANSFORM_BIT
+)
+
+
+def canonical(player:int, opponent:int):
+    """Return the minimal (player, opponent) among the 8 symmetries and the symmetry used."""
+    best = (player, opponent)
+    best_symmetry = 0
+    for symmetry in range(1, SYMMETRIES):
+        candidate = (transform(player, symmetry), transform(opponent, symmetry))
+        if candidate < best:
+            best, best_symmetry = candidate, symmetry
+    return best[0], best[1], best_symmetry
+
+class BitBoard:
+    """Board backend with the same contract as the array implementation.
+
+    The padded NumPy board is still the shared representation,
+    so display_board() and strategies reading the board are unaffected.
+    """
+
+    def split(self, board, game_turn:int):
+        """Return (player, opponent) masks for the side to move."""
+        return from_array(board, game_turn), from_array(board, game_turn*-1)
+
+    def reversible_area(self, board, game_turn:int):
+        """Select reversible area.
+
+        Returns
+        ----------
+        reversible : dict
+            {(row, column): [(row, column), ...]}
+        """
+        player, opponent = self.split(board, game_turn)
+        return {
+            SQUARE_OF_BIT[bit]: flip_squares(player, opponent, bit)
+            for bit in iterate_bits(legal_moves(player, opponent))
+        }
+
+    def count_disks(self, board, player_color:int):
+        """Count number of black and white disks and number of blank squares.
+        Returns
+        ----------
+        count_player, count_CPU, count_blank = int
+        """
+        player, opponent = self.split(board, player_color)
+        count_player = popcount(player)
+        count_CPU = popcount(opponent)
+        return count_player, count_CPU, BOARD_SIZE*BOARD_SIZE - count_player - count_CPU
+
+
+# Batched operations on NumPy arrays of boards.
+_UINT64_SHIFTS = tuple((np.uint64(abs(shift_)), shift_ > 0, np.uint64(mask)) for shift_, mask in SHIFTS)
+_SQUARE_BITS = np.left_shift(np.uint64(1), np.arange(BOARD_SIZE*BOARD_SIZE, dtype=np.uint64))
+
+
+def _batch_rays(bit:int):
+    """Square masks of each direction from bit, long enough to reverse a disk."""
+    rays = []
+    for x, y in DIRECTIONS:
+        ray = []
+        row, column = bit//BOARD_SIZE + x, bit%BOARD_SIZE + y
+        while 0 <= row < BOARD_SIZE and 0 <= column < BOARD_SIZE:
+            ray.append(np.uint64(1 << (row*BOARD_SIZE + column)))
+            row, column = row + x, column + y
+        if len(ray) >= 2:
+            rays.append(ray)
+    return rays
+
+_BATCH_RAYS = tuple(_batch_rays(bit) for bit in range(BOARD_SIZE*BOARD_SIZE))
+
+
+def _batch_shift(bits, direction:tuple):
+    shift_, is_left, mask = direction
+    if is_left:
+        return np.left_shift(bits, shift_) & mask
+    return np.right_shift(bits, shift_) & mask
+
+
+def batch_split(boards, game_turns):
+    """Return (players, opponents) uint64 arrays of the sides to move.
+
+    boards : numpy.ndarray
+        Stacked padded boards of shape (N, 10, 10),
+        or bitboards of shape (N, 2) whose columns are (black, white).
+    game_turns : numpy.ndarray
+        Sides to move of shape (N,), BLACK or WHITE.
+    """
+    boards = np.asarray(boards)
+    game_turns = np.asarray(game_turns)
+    if boards.ndim == 2:
+        boards = boards.astype(np.uint64)
+        is_black = game_turns == BLACK
+        return np.where(is_black, boards[:, 0], boards[:, 1]), np.where(is_black, boards[:, 1], boards[:, 0])
+
+    inner = boards[:, 1:-1, 1:-1].reshape(len(boards), BOARD_SIZE*BOARD_SIZE)
+    masks = []
+    for colors in (game_turns, game_turns*-1):
+        packed = np.packbits(inner == colors[:, None], axis=1, bitorder="little")
+        masks.append(np.ascontiguousarray(packed).view("<u8").ravel().astype(np.uint64))
+    return masks[0], masks[1]
+
+
+def batch_legal_moves(players, opponents):
+    """Return legal-move masks of many boards at once."""
+    empty = ~(players | opponents)
+    moves = np.zeros_like(players)
+    for direction in _UINT64_SHIFTS:
+        candidate = _batch_shift(players, direction) & opponents
+        for _ in range(5):
+            candidate |= _batch_shift(candidate, direction) & opponents
+        moves |= _batch_shift(candidate, direction) & empty
+    return moves
+
+
+def batch_flip_masks(players, opponents, moves=None):
+    """Return reversed-disk masks of every square of many boards at once.
+
+    Returns
+    ----------
+    flips : numpy.ndarray
+        uint64 array of shape (N, 64). flips[n, bit] is 0 if bit is not a legal move.
+    """
+    if moves is None:
+        moves = batch_legal_moves(players, opponents)
+    zero = np.uint64(0)
+    flips = np.zeros((len(players), BOARD_SIZE*BOARD_SIZE), dtype=np.uint64)
+    for bit in range(BOARD_SIZE*BOARD_SIZE):
+        # Only boards where bit is a legal move are examined.
+        rows = np.flatnonzero(moves & _SQUARE_BITS[bit])
+        if not len(rows):
+            continue
+        player = players[rows]
+        opponent = opponents[rows]
+        flipped = np.zeros(len(rows), dtype=np.uint64)
+        for ray in _BATCH_RAYS[bit]:
+            running = (opponent & ray[0]) != 0
+            line = np.where(running, ray[0], zero)
+            for square in ray[1:]:
+                if not running.any():
+                    break
+                flipped |= np.where(running & ((player & square) != 0), line, zero)
+                running &= (opponent & square) != 0
+                line |= np.where(running, square, zero)
+        flips[rows, bit] = flipped
+    return flips
+
+
+def batch_reversible(boards, game_turns, with_flips=True):
+    """Legal moves and reversed disks of many boards.
+
+    Returns
+    ----------
+    moves : numpy.ndarray
+        uint64 legal-move masks of shape (N,).
+    flips : numpy.ndarray or None
+        uint64 reversed-disk masks of shape (N, 64).
+    """
+    players, opponents = batch_split(boards, game_turns)
+    moves = batch_legal_moves(players, opponents)
+    if not with_flips:
+        return moves, None
+    return moves, batch_flip_masks(players, opponents, moves)
@@ -31,17 +31,69 @@ class MyFrame(wx.Frame):
         layout.Add(self._user_panel, proportion=1, flag=wx.EXPAND)
         self.SetSizer(layout)
 
-        self._timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.on_timer)
-        self._timer.Start(100)
         self.user_auto = False
+        self.set_game(othello)
         return
 
-    def on_timer(self, event):
-        self.result = self.othello.process_game()
+    def set_game(self, othello):
+        """Show othello and proceed it by its events."""
+        self.othello = othello
+        self.result = False
+        othello.subscribe(othello.MOVE, self.on_move)
+        othello.subscribe(othello.TURN, self.on_turn)
+        othello.subscribe(othello.GAME_OVER, self.on_game_over)
+        othello.subscribe(othello.SEARCHED, self.on_searched)
+        self.refresh()
+        wx.CallAfter(self.advance)
+        return
+
+    def refresh(self):
+        self._game_panel.refresh()
+        self._user_panel.refresh()
+        return
+
+    def advance(self):
+        """Proceed the game by one step.
+        While a strategy is to move, the game proceeds again when its background search finished.
+        """
+        if self.othello.result:
+            # Nothing proceeds until undo, redo or load restores the game.
+            return
+        self.result = self.othello.process_game(background=True)
+        if not self.result and self.othello.strategy_to_move():
+            self.SetStatusText("thinking...")
+        else:
+            self.SetStatusText("")
+        self._user_panel.refresh()
+        return
+
+    def on_move(self, row:int, column:int, game_turn:int):
+        self.refresh()
+        return
+
+    def on_turn(self, game_turn:int):
+        # The board may have been restored by undo, redo or load.
+        self.refresh()
+        wx.CallAfter(self.advance)
+        return
+
+    def on_game_over(self, result:str):
+        self.result = True
+        self._user_panel.refresh()
+        return
+
+    def on_searched(self):
+        # Called from the search thread; the game proceeds in the event loop.
+        wx.CallAfter(self.advance)
         return
 
 class GamePanel(wx.Panel):
+    """Board of the game.
+
+    The board background is drawn once per panel size into a cached bitmap.
+    Disks are repainted only on squares which changed since the last frame,
+    and nothing is drawn while the board version of the game is unchanged.
+    """
     def __init__(self, frame):
         wx.Panel.__init__(self, frame)
         self.SetBackgroundColour("white")
@@ -56,11 +108,16 @@ class GamePanel(wx.Panel):
                 self._disks[row][column] = Disk()
         self._square = SquareMap()
 
+        # Cached frame: panel size, board version and disks drawn on the bitmap
+        self._size = None
+        self._version = None
+        self._drawn = None
+        self._bit_map = None
+
         self._client_DC = wx.ClientDC(self)
-        self._timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.on_timer)
         self.Bind(wx.EVT_LEFT_DOWN, self.on_left_down)
-        self._timer.Start(100)
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+        self.Bind(wx.EVT_SIZE, self.on_size)
         return
 
     def on_left_down(self, event):
@@ -75,8 +132,7 @@ class GamePanel(wx.Panel):
         width, height = self.GetSize()
         BOARD_SIZE = min(width, height)*0.7
         DISK_SIZE = (BOARD_SIZE/7)*0.7/2
-        self._board = self._frame.othello.display_board()
-        
+
         self._width = width
         self._height = height
         self._BOARD_SIZE = BOARD_SIZE
@@ -88,28 +144,84 @@ class GamePanel(wx.Panel):
             [width/2 + (x-4)*BOARD_SIZE/7 for x in range(9)],
             [height/2 + (x-4)*BOARD_SIZE/7 for x in range(9)]
         ]
+        return
+
+    def draw_background(self):
+        """Draw the empty board once for the current size."""
+        self._background = wx.Bitmap(max(self._width, 1), max(self._height, 1))
+        memory_DC = wx.MemoryDC(self._background)
+        memory_DC.SetBackground(wx.Brush(self.GetBackgroundColour()))
+        memory_DC.Clear()
+        self._square.draw(memory_DC, self._line_position)
+        memory_DC.SelectObject(wx.NullBitmap)
+        return
+
+    def draw_disk(self, buffer_DC, row:int, column:int, disk:int):
+        """Draw one square; an empty square is painted in the color of the board."""
+        if disk == 1:
+            color = cp.COLOR_BLACK_DISK
+        elif disk == -1:
+            color = cp.COLOR_WHITE_DISK
+        else:
+            color = cp.COLOR_BOARD
+        self._disks[row][column].draw(color, buffer_DC, self._position[row][column], self._DISK_SIZE)
+        return
 
     def draw_board(self):
-        """Determine disks" position and draw area."""
-        self._bit_map = wx.Bitmap(self._width, self._height)
-        self._buffer_DC = wx.BufferedDC(self._client_DC, self._bit_map)
-        self._buffer_DC.Clear()
+        """Repaint squares changed since the last frame.
+        The whole board is drawn on the first frame and after a resize.
+        """
+        board = self._frame.othello.display_board()
+        if self._drawn is None:
+            self._bit_map = self._background.GetSubBitmap(
+                wx.Rect(0, 0, self._background.GetWidth(), self._background.GetHeight())
+                )
+            changed = [(row, column) for row in range(8) for column in range(8)]
+        else:
+            changed = [(row, column) for row in range(8) for column in range(8) if board[row][column] != self._drawn[row][column]]
 
-        self._square.draw(self._buffer_DC, self._line_position)
-        for row in range(8):
-            for column in range(8):
-                if self._board[row][column] == 1:
-                    self._disks[row][column].draw(cp.COLOR_BLACK_DISK, self._buffer_DC, self._position[row][column], self._DISK_SIZE)
-                elif self._board[row][column] == -1:
-                    self._disks[row][column].draw(cp.COLOR_WHITE_DISK, self._buffer_DC, self._position[row][column], self._DISK_SIZE)
-                else:
-                    self._disks[row][column].draw(cp.COLOR_BOARD, self._buffer_DC, self._position[row][column], self._DISK_SIZE)
+        memory_DC = wx.MemoryDC(self._bit_map)
+        for row, column in changed:
+            self.draw_disk(memory_DC, row, column, board[row][column])
+        if len(changed) == 64:
+            self._client_DC.Blit(0, 0, self._width, self._height, memory_DC, 0, 0)
+        else:
+            # Only the square around each changed disk is copied to the screen.
+            size = int(self._BOARD_SIZE/7) + 2
+            for row, column in changed:
+                x, y = self._position[row][column]
+                left, top = int(x - size/2), int(y - size/2)
+                self._client_DC.Blit(left, top, size, size, memory_DC, left, top)
+        memory_DC.SelectObject(wx.NullBitmap)
+        self._drawn = board.copy()
+        return
 
-        self._client_DC.DrawBitmap(self._bit_map, 0, 0)
+    def on_paint(self, event):
+        """Restore the panel from the cached frame when it was exposed."""
+        paint_DC = wx.PaintDC(self)
+        if self._bit_map is not None:
+            paint_DC.DrawBitmap(self._bit_map, 0, 0)
+        return
+
+    def on_size(self, event):
+        self.refresh()
+        event.Skip()
+        return
 
-    def on_timer(self, event):
-        self.update_data()
+    def refresh(self):
+        """Draw the board if the panel size or the board version changed."""
+        size = tuple(self.GetSize())
+        if size != self._size:
+            self._size = size
+            self.update_data()
+            self.draw_background()
+            self._drawn = None
+        version = self._frame.othello.board_version
+        if self._drawn is not None and version == self._version:
+            return
+        self._version = version
         self.draw_board()
+        return
 
 
 class UserPanel(wx.Panel):
@@ -127,17 +239,20 @@ class UserPanel(wx.Panel):
         layout.Add(self._CPU_point_panel, proportion=1, flag=wx.EXPAND)
         layout.Add(self._result_panel, proportion=1, flag=wx.EXPAND)
         self.SetSizer(layout)
-        
-        self._timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.on_timer)
-        self._timer.Start(100)
+        self.Bind(wx.EVT_SIZE, self.on_size)
+        return
+
+    def on_size(self, event):
+        event.Skip()
+        wx.CallAfter(self.refresh)
         return
 
-    def on_timer(self, event):
-        """Determine disks' position and draw area."""
+    def refresh(self):
+        """Show points and result. Panels draw only what changed."""
         self._user_point_panel.draw(self._frame.othello.count_player)
         self._CPU_point_panel.draw(self._frame.othello.count_CPU)
         self._result_panel.draw()
+        return
 
 
 class PointPanel(wx.Panel):
@@ -151,16 +266,30 @@ class PointPanel(wx.Panel):
             self._text = "You"
         else:
             self._text = "CPU"
+        # What the cached bitmap shows
+        self._shown = None
+        self._bit_map = None
         self._client_DC = wx.ClientDC(self)
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+
+    def on_paint(self, event):
+        paint_DC = wx.PaintDC(self)
+        if self._bit_map is not None:
+            paint_DC.DrawBitmap(self._bit_map, 0, 0)
+        return
 
     def draw(self, point:int):
-        """Show each player's points."""
+        """Show each player's points, unless they are already shown."""
         width, height = self.GetSize()
         size = min(width, height)
         if self._is_player * self._frame.othello._player_color == 1:
             color = cp.COLOR_BLACK_DISK
         else:
             color = cp.COLOR_WHITE_DISK
+        shown = (point, color, width, height)
+        if shown == self._shown:
+            return
+        self._shown = shown
 
         self._bit_map = wx.Bitmap(width, height)
         self._buffer_DC = wx.BufferedDC(self._client_DC, self._bit_map)
@@ -184,15 +313,29 @@ class ResultPanel(wx.Panel):
         wx.Panel.__init__(self, panel)
         self._frame = frame
         self._text = ""
+        self._shown = None
+        self._bit_map = None
         self._client_DC = wx.ClientDC(self)
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+
+    def on_paint(self, event):
+        paint_DC = wx.PaintDC(self)
+        if self._bit_map is not None:
+            paint_DC.DrawBitmap(self._bit_map, 0, 0)
+        return
 
     def draw(self):
+        """Show the result, unless it is already shown."""
         width, height = self.GetSize()
         size = min(width, height)
         if self._frame.result:
             self._text = self._frame.othello.result
         else:
             self._text = ""
+        shown = (self._text, width, height)
+        if shown == self._shown:
+            return
+        self._shown = shown
 
         self._bit_map = wx.Bitmap(width, height)
         self._buffer_DC = wx.BufferedDC(self._client_DC, self._bit_map)
@@ -240,16 +383,15 @@ class SquareMap(object):
 
         buffer_DC.SetPen(wx.Pen(cp.COLOR_BOARD_LINE))
         buffer_DC.SetBrush(wx.Brush(cp.COLOR_BOARD_LINE))
-        for row in range(9):
-            for column in range(9):
-                buffer_DC.DrawLine(
-                    line_position[0][row], line_position[1][0], 
-                    line_position[0][row], line_position[1][-1]
-                    )
-                buffer_DC.DrawLine(
-                    line_position[0][0], line_position[1][column], 
-                    line_position[0][-1], line_position[1][column]
-                    )
+        for index in range(9):
+            buffer_DC.DrawLine(
+                line_position[0][index], line_position[1][0],
+                line_position[0][index], line_position[1][-1]
+                )
+            buffer_DC.DrawLine(
+                line_position[0][0], line_position[1][index],
+                line_position[0][-1], line_position[1][index]
+                )
         for row in range(1, 8):
             for column in range(1, 8):
                 buffer_DC.DrawCircle(line_position[0][row], line_position[1][column], edge_length*0.005)
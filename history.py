@@ -0,0 +1,153 @@
+"""Compact move history of othello.
+"""
+
+from bitboard import BLACK, bit_to_square, iterate_bits, square_to_bit
+
+
+class MoveLog:
+    """History stored as moves instead of boards.
+
+    Each ply is (bit, reversed-disk mask, color), so undo and redo
+    only touch the changed squares. Marks group plies into turns,
+    which are the units of undo and redo.
+    Keyframes of both bitboards are kept every keyframe_interval plies
+    for random access by position().
+    """
+
+    def __init__(self, black:int, white:int, game_turn:int, keyframe_interval=16):
+        self._plies = []
+        self._marks = [(0, game_turn)]
+        self._redo = []
+        self._keyframe_interval = keyframe_interval
+        self._keyframes = {0: (black, white)}
+        self._black = black
+        self._white = white
+        return
+
+    def __len__(self):
+        return len(self._plies)
+
+    def _apply(self, board, ply:tuple):
+        """Put a disk of ply on board and the bitboards."""
+        bit, flipped, color = ply
+        row, column = bit_to_square(bit)
+        board[row, column] = color
+        for flipped_bit in iterate_bits(flipped):
+            row, column = bit_to_square(flipped_bit)
+            board[row, column] *= -1
+        if color == BLACK:
+            self._black |= flipped | (1 << bit)
+            self._white ^= flipped
+        else:
+            self._white |= flipped | (1 << bit)
+            self._black ^= flipped
+        self._plies.append(ply)
+        if self._keyframe_interval and len(self._plies)%self._keyframe_interval == 0:
+            self._keyframes[len(self._plies)] = (self._black, self._white)
+        return
+
+    def _take_back(self, board):
+        """Remove the last ply from board and the bitboards."""
+        if len(self._plies) in self._keyframes and len(self._plies) != 0:
+            del self._keyframes[len(self._plies)]
+        bit, flipped, color = ply = self._plies.pop()
+        row, column = bit_to_square(bit)
+        board[row, column] = 0
+        for flipped_bit in iterate_bits(flipped):
+            row, column = bit_to_square(flipped_bit)
+            board[row, column] *= -1
+        if color == BLACK:
+            self._black &= ~(flipped | (1 << bit))
+            self._white |= flipped
+        else:
+            self._white &= ~(flipped | (1 << bit))
+            self._black |= flipped
+        return ply
+
+    def push(self, board, row:int, column:int, reversed_disks:list, color:int):
+        """Put a disk on board and record it. Redo history is cleared."""
+        flipped = 0
+        for x, y in reversed_disks:
+            flipped |= 1 << square_to_bit(x, y)
+        self._apply(board, (square_to_bit(row, column), flipped, color))
+        self._redo = []
+        return
+
+    def mark(self, game_turn:int):
+        """Close a turn. game_turn is the side to move after it."""
+        self._marks.append((len(self._plies), game_turn))
+        return
+
+    def undo(self, board, game_turn=None):
+        """Go back to the last mark, or to the mark before it if no ply was played since.
+        Plies after the last mark, e.g. a move played while the CPU searches, are one unit.
+
+        game_turn : int or None
+            The side to move now, restored by redo.
+
+        Returns
+        ----------
+        game_turn : int or None
+            The side to move, or None if there is nothing to undo.
+        """
+        start = self._marks[-1][0]
+        if len(self._plies) > start:
+            last = None
+        elif len(self._marks) < 2:
+            return None
+        else:
+            last = self._marks.pop()
+            start = self._marks[-1][0]
+        plies = []
+        while len(self._plies) > start:
+            plies.append(self._take_back(board))
+        plies.reverse()
+        self._redo.append((plies, last, game_turn))
+        return self._marks[-1][1]
+
+    def redo(self, board):
+        """Go forward by the last undo.
+
+        Returns
+        ----------
+        game_turn : int or None
+            The side to move, or None if there is nothing to redo.
+        """
+        if not self._redo:
+            return None
+        plies, last, game_turn = self._redo.pop()
+        for ply in plies:
+            self._apply(board, ply)
+        if last is not None:
+            self._marks.append(last)
+            return last[1]
+        if game_turn is None:
+            # The opponent of the last ply, as the game was left unmarked after it.
+            game_turn = -plies[-1][2]
+        return game_turn
+
+    def position(self, ply:int):
+        """Return (black, white) bitboards after ply plies, replayed from the nearest keyframe."""
+        start = max(index for index in self._keyframes if index <= ply)
+        black, white = self._keyframes[start]
+        for bit, flipped, color in self._plies[start:ply]:
+            if color == BLACK:
+                black |= flipped | (1 << bit)
+                white ^= flipped
+            else:
+                white |= flipped | (1 << bit)
+                black ^= flipped
+        return black, white
+
+    def save(self):
+        """Return a snapshot of the history. Plies are shared, so only the lists are copied."""
+        return (
+            list(self._plies), list(self._marks), list(self._redo),
+            dict(self._keyframes), self._black, self._white,
+        )
+
+    def load(self, saved:tuple):
+        """Restore a snapshot of save()."""
+        plies, marks, redo, keyframes, self._black, self._white = saved
+        self._plies, self._marks, self._redo, self._keyframes = list(plies), list(marks), list(redo), dict(keyframes)
+        return
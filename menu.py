@@ -1,5 +1,4 @@
 """Class of menu bar."""
-import copy
 import wx
 
 import othello
@@ -10,6 +9,7 @@ class MenuBar(wx.MenuBar):
     def __init__(self, frame):
         super().__init__()
         self._frame = frame
+        self._save = None
 
         menu_file = wx.Menu()
         menu_file.Append(wx.ID_SAVE, "Save")
@@ -44,23 +44,21 @@ class MenuBar(wx.MenuBar):
     
     def save_board(self):
         """Save current board."""
-        self._save = copy.deepcopy(self._frame.othello._board)
-        self._board_log = copy.deepcopy(self._frame.othello.board_log)
-        self._board_log_redo = copy.deepcopy(self._frame.othello.board_log_redo)
+        self._save = self._frame.othello.save_game()
         return
 
     def load_board(self):
         """Load saved board."""
-        self._frame.othello._board = copy.deepcopy(self._save)
-        self._frame.othello.board_log = copy.deepcopy(self._board_log)
-        self._frame.othello.board_log_redo = copy.deepcopy(self._board_log_redo)
+        if self._save is not None:
+            self._frame.othello.load_game(self._save)
         return
 
     def initialize_game(self):
         """Initialize board."""
+        self._frame.othello.cancel_search()
         game = othello.OthelloGame()
         game.load_strategy(Strategy)
-        self._frame.othello = game
+        self._frame.set_game(game)
         return
 
     def close_game(self):
@@ -78,18 +76,20 @@ class MenuBar(wx.MenuBar):
     def change_settings(self, event):
         """Change settings."""
         # Change procedure.
+        if event.GetId() in (self._id_color_black, self._id_color_white, self._id_color_random):
+            self._frame.othello.cancel_search()
         if event.GetId() == self._id_color_black:
             game = othello.OthelloGame(player_color='black')
             game.load_strategy(Strategy)
-            self._frame.othello = game
+            self._frame.set_game(game)
         if event.GetId() == self._id_color_white:
             game = othello.OthelloGame(player_color='white')
             game.load_strategy(Strategy)
-            self._frame.othello = game
+            self._frame.set_game(game)
         if event.GetId() == self._id_color_random:
             game = othello.OthelloGame(player_color='random')
             game.load_strategy(Strategy)
-            self._frame.othello = game
+            self._frame.set_game(game)
 
         # Change_strategy.  
         if event.GetId() == self._id_random:
@@ -1,12 +1,15 @@
 """Python de Othello
 """
 
-from collections import deque
 import copy
 import numpy as np
-from collections import deque
 import random
 
+from bitboard import BitBoard, from_array, to_array
+from history import MoveLog
+from rays import ArrayBoard
+from worker import SearchWorker
+
 
 class OthelloGame:
     """Play othello.
@@ -19,7 +22,13 @@ class OthelloGame:
     WALL = 2
     BOARD_SIZE = 8
 
-    def __init__(self, player_color='black'):
+    # Events of subscribe()
+    MOVE = "move"
+    TURN = "turn"
+    GAME_OVER = "game_over"
+    SEARCHED = "searched"
+
+    def __init__(self, player_color='black', backend='array'):
         # Set a board
         self.board = np.zeros((OthelloGame.BOARD_SIZE + 2, OthelloGame.BOARD_SIZE + 2), dtype=int)
         self.board[ 0,] = OthelloGame.WALL
@@ -46,14 +55,50 @@ class OthelloGame:
         self.count_CPU = 2
         self.count_blank = 60
         self.count_pass = 0
+        # Incremented whenever disks on the board change, so that views can skip unchanged frames
+        self.board_version = 0
+        # Versions for which legal moves and counts were computed; legal moves depend on the side to move as well.
+        self._reversible_key = None
+        self._count_version = self.board_version
 
         # Logger
-        self.board_log = deque([])
-        self.board_log.append(copy.deepcopy(self.board))
-        self.board_log_redo = deque([])
+        self.history = MoveLog(from_array(self.board, OthelloGame.BLACK), from_array(self.board, OthelloGame.WHITE), self._game_turn)
 
         # Mode
         self.player_auto = False
+
+        # Backend of move generation: "array" walks precomputed rays over the board,
+        # "bitboard" generates moves from masks packed from the board on each call,
+        # which is about twice as slow. Disks are put by history either way.
+        if backend == "bitboard":
+            self._backend = BitBoard()
+        else:
+            self._backend = ArrayBoard()
+
+        # Background search of strategies
+        self._worker = SearchWorker()
+
+        # Subscribers of game events
+        self._listeners = {OthelloGame.MOVE: [], OthelloGame.TURN: [], OthelloGame.GAME_OVER: [], OthelloGame.SEARCHED: []}
+        return
+
+    def subscribe(self, event:str, callback):
+        """Call callback when event happens.
+
+        event : str
+            MOVE : callback(row, column, game_turn) after game_turn put a disk.
+            TURN : callback(game_turn) after the side to move changed, the board was restored,
+                or a background search was cancelled, so that the side to move has to be searched again.
+            GAME_OVER : callback(result) when the game ends.
+            SEARCHED : callback() from the search thread when a background search finished.
+        """
+        self._listeners[event].append(callback)
+        return
+
+    def notify(self, event:str, *args):
+        """Call the subscribers of event."""
+        for callback in self._listeners[event]:
+            callback(*args)
         return
 
     def auto_mode(self, automode:bool):
@@ -68,6 +113,8 @@ class OthelloGame:
 
     def choice_player(self, row:int, column:int):
         """Manual mode of player's selection."""
+        if self._game_turn != self._player_color:
+            return
         self.reversible_area()
         if self.is_reversible(row, column):
             self.reverse(row, column)
@@ -79,7 +126,34 @@ class OthelloGame:
         """Auto mode of CPU's selection."""
         return self._Strategy_CPU.selecter(self)
 
-    def change_strategy(self, strategy, is_player=False):
+    def search_background(self, Strategy):
+        """Background mode of selection.
+        Return the selected square when the search finished, otherwise None.
+        """
+        if self._worker.done(Strategy):
+            return self._worker.result()
+        if not self._worker.running():
+            self._worker.start(Strategy, self, lambda: self.notify(OthelloGame.SEARCHED))
+        return None
+
+    def search_progress(self):
+        """Return progress of the background search."""
+        return self._worker.poll()
+
+    def cancel_search(self):
+        """Cancel the background search."""
+        return self._worker.cancel()
+
+    def snapshot(self):
+        """Return a copy of the game which a background search can read safely."""
+        game = copy.copy(self)
+        game.board = self.board.copy()
+        game.reversible = dict(self.reversible)
+        # A search must not notify the subscribers of the game.
+        game._listeners = {event: [] for event in self._listeners}
+        return game
+
+    def change_strategy(self, strategy, is_player=False, time_limit=None):
         """You can select AI strategy from candidates below.
 
         strategy : str
@@ -88,53 +162,47 @@ class OthelloGame:
             minimize : Put disk to minimize number of one's disks.
             openness : Put disk based on openness theory.
             evenness : Put disk based on evenness theory.
+            min-max : Find a better move by min-max method.
 
         is_player : bool
             Default is True.
+
+        time_limit : float or None
+            Time budget per move in seconds for min-max.
         """
+        self.cancel_search()
         if is_player:
-            self._Strategy_player.set_strategy(strategy)
+            self._Strategy_player.set_strategy(strategy, time_limit)
         else:
-            self._Strategy_CPU.set_strategy(strategy)
+            self._Strategy_CPU.set_strategy(strategy, time_limit)
+        # The cancelled search never reports its end, so the new strategy is started by this event.
+        self.notify(OthelloGame.TURN, self._game_turn)
         return
 
     def count_disks(self):
-        """Count number of black and white disks and number of blank squares."""
-        self.count_player = np.count_nonzero(self.board==self._player_color)
-        self.count_CPU    = np.count_nonzero(self.board==self._player_color*-1)
-        self.count_blank  = np.count_nonzero(self.board==OthelloGame.BLANK)
+        """Count number of black and white disks and number of blank squares.
+        Counts are kept until the board changes.
+        """
+        if self._count_version != self.board_version:
+            self.count_player, self.count_CPU, self.count_blank = self._backend.count_disks(self.board, self._player_color)
+            self._count_version = self.board_version
+        return
 
     def change_turn(self):
         self._game_turn *= -1
         self.count_disks()
         self.reversible_area()
+        self.notify(OthelloGame.TURN, self._game_turn)
         return
 
     def reversible_area(self):
-        """Select reversible area."""
-        self.reversible = {}
-        dx = (-1, 0, 1)
-        dy = (-1, 0, 1)
-        for row in range(1, OthelloGame.BOARD_SIZE+1):
-            for column in range(1, OthelloGame.BOARD_SIZE+1):
-                if self.board[row, column] != 0:
-                    continue
-                for x in dx:
-                    for y in dy:
-                        if self._game_turn+self.board[row+x,column+y] == 0:
-                            coefficient = 2
-                            while True:
-                                if self.board[row+x*coefficient, column+y*coefficient] == self._game_turn:
-                                    if (row, column) not in self.reversible.keys():
-                                        self.reversible[(row, column)] = []
-                                    for coefficient_ in range(1, coefficient):
-                                        self.reversible[(row, column)].append((row+x*coefficient_, column+y*coefficient_))
-                                    break
-                                elif self.board[row+x*coefficient, column+y*coefficient] == self._game_turn*-1:
-                                    pass
-                                else:
-                                    break
-                                coefficient += 1
+        """Select reversible area.
+        Legal moves and their reversed disks are kept until the board or the side to move changes.
+        """
+        key = (self.board_version, self._game_turn)
+        if self._reversible_key != key:
+            self.reversible = self._backend.reversible_area(self.board, self._game_turn)
+            self._reversible_key = key
         return self.reversible
 
     def is_reversible(self, row:int, column:int):
@@ -143,23 +211,36 @@ class OthelloGame:
 
     def reverse(self, row:int, column:int):
         """Put a disk and reverse disks."""
-        self.board[row, column] = self._game_turn
-        for x, y in self.reversible[(row, column)]:
-            self.board[x, y] *= -1
-        self.board_log_redo = deque([])
+        self.history.push(self.board, row, column, self.reversible[(row, column)], self._game_turn)
+        self.board_version += 1
+        self.notify(OthelloGame.MOVE, row, column, self._game_turn)
         return
 
+    def strategy_to_move(self):
+        """Return wheather the side to move is played by a strategy."""
+        return self._game_turn != self._player_color or self.player_auto
+
     def turn_playable(self):
         """Return wheather you can put disk or not."""
         return self.reversible != {}
 
-    def process_game(self):
+    def process_game(self, background=False):
+        """Proceed the game by one step.
+
+        background : bool
+            If True, strategies search in a background thread and
+            this method returns without waiting for the result.
+        """
         self.reversible_area()
         if self._game_turn == self._player_color:
             if self.turn_playable():
                 if self.player_auto:
-                    self.choice_player(*self._Strategy_player.selecter(self))
-                    pass
+                    if background:
+                        selected = self.search_background(self._Strategy_player)
+                        if selected is not None:
+                            self.choice_player(*selected)
+                    else:
+                        self.choice_player(*self._Strategy_player.selecter(self))
                 else:
                     pass
             else:
@@ -167,7 +248,13 @@ class OthelloGame:
                 self.count_pass += 1
         else:
             if self.turn_playable():
-                self.reverse(*self.choice_CPU())
+                if background:
+                    selected = self.search_background(self._Strategy_CPU)
+                    if selected is None:
+                        return False
+                else:
+                    selected = self.choice_CPU()
+                self.reverse(*selected)
                 self.change_turn()
                 self.count_pass = 0
             else:
@@ -180,19 +267,45 @@ class OthelloGame:
             return False
 
     def log_turn(self):
-        """Append data to board_log."""
-        return self.board_log.append(copy.deepcopy(self.board))
+        """Close a turn of history."""
+        return self.history.mark(self._game_turn)
 
-    def undo_turn(self):
-        if self.board_log != deque([]):
-            self.board_log_redo.append(self.board_log.pop())
-            self.board = copy.deepcopy(self.board_log[-1])
+    def restore_turn(self, game_turn):
+        """Set the side to move after the board was changed by history.
+        If history had nothing to restore, subscribers are still notified,
+        since a background search was cancelled before.
+        """
+        if game_turn is None:
+            self.notify(OthelloGame.TURN, self._game_turn)
+            return
+        self.board_version += 1
+        self._game_turn = game_turn
+        self.count_pass = 0
+        self.result = ""
+        self.count_disks()
+        self.reversible_area()
+        self.notify(OthelloGame.TURN, self._game_turn)
         return
 
+    def undo_turn(self):
+        self.cancel_search()
+        return self.restore_turn(self.history.undo(self.board, self._game_turn))
+
     def redo_turn(self):
-        if self.board_log_redo != deque([]):
-            self.board_log.append(self.board_log_redo.pop())
-            self.board = copy.deepcopy(self.board_log[-1])
+        self.cancel_search()
+        return self.restore_turn(self.history.redo(self.board))
+
+    def save_game(self):
+        """Return a snapshot of the game for load_game."""
+        return self.history.save(), self._game_turn
+
+    def load_game(self, saved:tuple):
+        """Restore a snapshot of save_game."""
+        self.cancel_search()
+        history, game_turn = saved
+        self.history.load(history)
+        self.board = to_array(*self.history.position(len(self.history)))
+        self.restore_turn(game_turn)
         return
 
     def display_board(self):
@@ -202,11 +315,15 @@ class OthelloGame:
     def game_judgement(self):
         """Judgement of game."""
         if self.count_pass >= 2 or self.count_blank == 0:
+            # Subscribers are notified once, not on every later step.
+            ended = self.result == ""
             if self.count_player == self.count_CPU:
                 self.result = "DRAW"
             if self.count_player > self.count_CPU:
                 self.result = "WIN"
             if self.count_player < self.count_CPU:
                 self.result = "LOSE"
+            if ended:
+                self.notify(OthelloGame.GAME_OVER, self.result)
             return True
         return False
\ No newline at end of file
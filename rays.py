@@ -0,0 +1,89 @@
+"""Precomputed rays of the 64 squares.
+
+Tables are built once at import. A square is addressed either by its bit
+(row-1)*8 + (column-1) or by its index row*10 + column in the raveled
+padded 10x10 board. Rays are listed in the order of the directions
+(-1,-1), (-1,0), ..., (1,1) and run outward from the square.
+"""
+
+import numpy as np
+
+BOARD_SIZE = 8
+WIDTH = BOARD_SIZE + 2
+
+# (row delta, column delta) of the eight directions.
+DIRECTIONS = tuple((x, y) for x in (-1, 0, 1) for y in (-1, 0, 1) if (x, y) != (0, 0))
+
+# (row, column) of each bit, and of each index of the raveled padded board.
+SQUARE_OF_BIT = tuple((bit//BOARD_SIZE + 1, bit%BOARD_SIZE + 1) for bit in range(BOARD_SIZE*BOARD_SIZE))
+SQUARE_OF_INDEX = tuple(divmod(index, WIDTH) for index in range(WIDTH*WIDTH))
+INDEX_OF_BIT = tuple(row*WIDTH + column for row, column in SQUARE_OF_BIT)
+
+
+def _ray(bit:int, direction:tuple):
+    """Bits from bit to the edge in direction, bit itself excluded."""
+    row, column = SQUARE_OF_BIT[bit]
+    x, y = direction
+    ray = []
+    row, column = row + x, column + y
+    while 1 <= row <= BOARD_SIZE and 1 <= column <= BOARD_SIZE:
+        ray.append((row - 1)*BOARD_SIZE + column - 1)
+        row, column = row + x, column + y
+    return tuple(ray)
+
+
+# Rays of each bit in bits and in indices of the padded board.
+# Rays shorter than 2 squares cannot reverse a disk and are left out.
+RAY_BITS = tuple(
+    tuple(ray for ray in (_ray(bit, direction) for direction in DIRECTIONS) if len(ray) >= 2)
+    for bit in range(BOARD_SIZE*BOARD_SIZE)
+)
+RAY_INDICES = tuple(
+    tuple(tuple(INDEX_OF_BIT[square] for square in ray) for ray in rays) for rays in RAY_BITS
+)
+
+
+def reversible_area(board, game_turn:int):
+    """Select reversible area of the padded board by walking the rays.
+
+    Returns
+    ----------
+    reversible : dict
+        {(row, column): [(row, column), ...]}
+    """
+    cells = board.ravel().tolist()
+    opponent = game_turn*-1
+    reversible = {}
+    for index, rays in zip(INDEX_OF_BIT, RAY_INDICES):
+        if cells[index]:
+            continue
+        reversed_disks = []
+        for ray in rays:
+            if cells[ray[0]] != opponent:
+                continue
+            for length in range(1, len(ray)):
+                cell = cells[ray[length]]
+                if cell == game_turn:
+                    reversed_disks.extend(SQUARE_OF_INDEX[square] for square in ray[:length])
+                    break
+                if cell != opponent:
+                    break
+        if reversed_disks:
+            reversible[SQUARE_OF_INDEX[index]] = reversed_disks
+    return reversible
+
+
+class ArrayBoard:
+    """Board backend on the padded NumPy board, with the same contract as BitBoard."""
+
+    def reversible_area(self, board, game_turn:int):
+        return reversible_area(board, game_turn)
+
+    def count_disks(self, board, player_color:int):
+        """Count number of black and white disks and number of blank squares."""
+        inner = board[1:-1, 1:-1]
+        return (
+            int(np.count_nonzero(inner == player_color)),
+            int(np.count_nonzero(inner == player_color*-1)),
+            int(np.count_nonzero(inner == 0)),
+        )
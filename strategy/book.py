@@ -0,0 +1,162 @@
+"""Opening book of othello.
+
+The book is a sorted binary file of fixed-size records
+(player, opponent, move, evaluation), keyed by the canonical position
+among the 8 symmetries. It is read through mmap and searched by
+bisection, so nothing is loaded at startup.
+
+Build
+----------
+python -m strategy.book --plies 6 --depth 5 --output strategy/book.bin
+
+The evaluations of strategy/book.bin come from the pattern evaluation of
+strategy/pattern.npz, as Minmax uses by default. Rebuild the book after
+the weights are retrained.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import time
+
+from bitboard import (
+    BLACK, INVERSE_BIT, WHITE, bit_to_square, canonical, flip_mask, from_array,
+    iterate_bits, legal_moves, square_to_bit, to_array,
+)
+
+MAGIC = b"OTHBOOK1"
+HEADER = struct.Struct("<8sI")
+RECORD = struct.Struct("<QQBh")
+DEFAULT_BOOK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "book.bin")
+
+# Maps of book files by (path, modification time), shared by every OpeningBook of the process.
+_MAPS = {}
+
+
+class OpeningBook:
+    """Read-only opening book on a memory-mapped file."""
+
+    def __init__(self, path=DEFAULT_BOOK):
+        self._path = path
+        self._mmap = None
+        self._count = 0
+        return
+
+    def open(self):
+        """Map the file on first use. Return False if the book is not available."""
+        if self._mmap is not None:
+            return True
+        try:
+            key = (self._path, os.stat(self._path).st_mtime_ns)
+            if key not in _MAPS:
+                with open(self._path, "rb") as file_:
+                    mapped = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, count = HEADER.unpack_from(mapped, 0)
+                if magic != MAGIC or len(mapped) != HEADER.size + count*RECORD.size:
+                    mapped.close()
+                    return False
+                _MAPS[key] = mapped
+        except (OSError, ValueError, struct.error):
+            return False
+        self._mmap = _MAPS[key]
+        self._count = HEADER.unpack_from(self._mmap, 0)[1]
+        return True
+
+    def close(self):
+        """Drop the map of this book. It stays shared with other books of the same file."""
+        self._mmap = None
+        return
+
+    def __len__(self):
+        return self._count if self.open() else 0
+
+    def _find(self, player:int, opponent:int):
+        """Bisect records for the canonical key."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high)//2
+            record = RECORD.unpack_from(self._mmap, HEADER.size + middle*RECORD.size)
+            if (record[0], record[1]) < (player, opponent):
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            record = RECORD.unpack_from(self._mmap, HEADER.size + low*RECORD.size)
+            if (record[0], record[1]) == (player, opponent):
+                return record
+        return None
+
+    def lookup(self, board, game_turn:int):
+        """Return (evaluation, (row, column)) of the book move, or None if the position is not in book."""
+        if not self.open():
+            return None
+        player, opponent, symmetry = canonical(from_array(board, game_turn), from_array(board, game_turn*-1))
+        record = self._find(player, opponent)
+        if record is None:
+            return None
+        return record[3], bit_to_square(INVERSE_BIT[symmetry][record[2]])
+
+
+def write_book(path:str, entries:dict):
+    """Write {(player, opponent): (move bit, evaluation)} as a sorted book file."""
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file_:
+        file_.write(HEADER.pack(MAGIC, len(entries)))
+        for (player, opponent), (bit, evaluation) in sorted(entries.items()):
+            file_.write(RECORD.pack(player, opponent, bit, max(-2**15, min(2**15 - 1, evaluation))))
+    os.replace(temporary, path)
+    return
+
+
+def build_book(plies:int, depth:int, evaluation="pattern", verbose=True):
+    """Search every canonical position within plies from the start,
+    with the evaluation of Minmax. Building stops if the pattern weights are missing,
+    instead of falling back to the matrices as Minmax does.
+
+    Returns
+    ----------
+    entries : dict
+        {(player, opponent): (move bit, evaluation)} in canonical orientation.
+    """
+    from othello import OthelloGame
+    from .minmax import Minmax
+
+    minmax = Minmax(endgame_empties=None, evaluation=evaluation)
+    if evaluation == "pattern" and minmax._pattern is None:
+        raise FileNotFoundError("pattern weights are missing; train them with python -m strategy.pattern")
+    board = OthelloGame(player_color="black").board
+    entries = {}
+    frontier = {canonical(from_array(board, BLACK), from_array(board, WHITE))[:2]}
+    start = time.perf_counter()
+    for ply in range(plies + 1):
+        next_frontier = set()
+        for player, opponent in sorted(frontier):
+            moves = legal_moves(player, opponent)
+            if not moves:
+                continue
+            # Search the canonical position with black to move; colors do not matter to the search.
+            board = to_array(player, opponent)
+            minmax.prepare_search()
+            evaluation, selected = minmax.min_max(board, BLACK, depth, minmax._zobrist.hashing(board, BLACK))
+            entries[(player, opponent)] = (square_to_bit(*selected), evaluation)
+
+            if ply < plies:
+                for move in iterate_bits(moves):
+                    flipped = flip_mask(player, opponent, move)
+                    next_player, next_opponent = opponent ^ flipped, player | flipped | (1 << move)
+                    next_frontier.add(canonical(next_player, next_opponent)[:2])
+        if verbose:
+            print("ply {}: {} positions, {:.1f} s".format(ply, len(entries), time.perf_counter() - start))
+        frontier = next_frontier
+    return entries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plies", type=int, default=6)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--evaluation", default="pattern", choices=("pattern", "matrix"))
+    parser.add_argument("--output", default=DEFAULT_BOOK)
+    args = parser.parse_args()
+    write_book(args.output, build_book(args.plies, args.depth, args.evaluation))
@@ -0,0 +1,143 @@
+"""Memory-mapped transposition cache on disk.
+
+The file has a header with a checksum and a fixed number of slots.
+A slot is (key, evaluation, depth, bound, move, check), where check is
+a checksum byte of the other fields, so a torn write reads as a miss.
+Slots are read lazily through mmap, and several processes can open
+the same file read-only.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+
+from bitboard import bit_to_square, square_to_bit
+from .transposition import EXACT, INVERSE_SQUARE, LOWER, TRANSFORM_SQUARE, UPPER, canonical_key
+
+MAGIC = b"OTHCACHE"
+VERSION = 1
+HEADER = struct.Struct("<8sIII")
+RECORD = struct.Struct("<QqBBBB")
+NO_MOVE = 0xFF
+
+
+def _header_checksum(slots:int):
+    return zlib.crc32(MAGIC + struct.pack("<II", VERSION, slots))
+
+
+def _record_check(key:int, evaluation:int, depth:int, bound:int, move:int):
+    return zlib.crc32(RECORD.pack(key, evaluation, depth, bound, move, 0)) & 0xFF
+
+
+class DiskCache:
+    """Transposition cache of a fixed number of slots in a file.
+
+    readonly : bool
+        If True, the file is only mapped for reading and store() is ignored.
+        A missing or corrupted file disables the cache.
+        Otherwise such a file is created anew.
+    """
+
+    def __init__(self, path:str, slots=2**18, readonly=False):
+        self._path = path
+        self._slots = slots
+        self._readonly = readonly
+        self._mmap = None
+        self.corrupted = False
+        self._open()
+        return
+
+    def _create(self):
+        """Write an empty file and replace the old one at once."""
+        temporary = self._path + ".tmp"
+        with open(temporary, "wb") as file_:
+            file_.write(HEADER.pack(MAGIC, VERSION, self._slots, _header_checksum(self._slots)))
+            file_.truncate(HEADER.size + self._slots*RECORD.size)
+        os.replace(temporary, self._path)
+        return
+
+    def _valid(self):
+        magic, version, slots, checksum = HEADER.unpack_from(self._mmap, 0)
+        return (
+            magic == MAGIC and version == VERSION and checksum == _header_checksum(slots)
+            and len(self._mmap) == HEADER.size + slots*RECORD.size
+        )
+
+    def _open(self):
+        access = mmap.ACCESS_READ if self._readonly else mmap.ACCESS_WRITE
+        mode = "rb" if self._readonly else "r+b"
+        for _ in range(2):
+            try:
+                with open(self._path, mode) as file_:
+                    self._mmap = mmap.mmap(file_.fileno(), 0, access=access)
+                if len(self._mmap) >= HEADER.size and self._valid():
+                    self._slots = HEADER.unpack_from(self._mmap, 0)[2]
+                    return
+                self.corrupted = True
+                self.close()
+            except (OSError, ValueError):
+                self._mmap = None
+            if self._readonly:
+                return
+            self._create()
+        return
+
+    def __len__(self):
+        return self._slots if self._mmap is not None else 0
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        return
+
+    def flush(self):
+        if self._mmap is not None and not self._readonly:
+            self._mmap.flush()
+        return
+
+    def _read(self, key:int):
+        offset = HEADER.size + (key % self._slots)*RECORD.size
+        record = RECORD.unpack_from(self._mmap, offset)
+        if record[0] != key or record[5] != _record_check(*record[:5]):
+            return None
+        return record
+
+    def lookup(self, key:int, depth:int, alpha:float, beta:float):
+        """Same contract as TranspositionTable.lookup."""
+        if self._mmap is None:
+            return False, None, None
+        key, symmetry = canonical_key(key)
+        record = self._read(key)
+        if record is None:
+            return False, None, None
+        _, evaluation, stored_depth, bound, move, _ = record
+        selected = None if move == NO_MOVE else INVERSE_SQUARE[symmetry][bit_to_square(move)]
+        if stored_depth >= depth:
+            if bound == EXACT:
+                return True, evaluation, selected
+            if bound == LOWER and evaluation >= beta:
+                return True, evaluation, selected
+            if bound == UPPER and evaluation <= alpha:
+                return True, evaluation, selected
+        return False, None, selected
+
+    def store(self, key:int, depth:int, bound:int, evaluation:int, selected):
+        """Write one slot if it is empty, has the same key or is not deeper.
+        The record is written with a single copy into the map.
+        """
+        if self._mmap is None or self._readonly:
+            return
+        key, symmetry = canonical_key(key)
+        if selected is not None:
+            selected = TRANSFORM_SQUARE[symmetry][selected]
+        offset = HEADER.size + (key % self._slots)*RECORD.size
+        stored_key, _, stored_depth, _, _, _ = RECORD.unpack_from(self._mmap, offset)
+        if stored_key != 0 and stored_key != key and stored_depth > depth:
+            return
+        move = NO_MOVE if selected is None else square_to_bit(*selected)
+        evaluation = int(evaluation)
+        check = _record_check(key, evaluation, depth, bound, move)
+        self._mmap[offset:offset + RECORD.size] = RECORD.pack(key, evaluation, depth, bound, move, check)
+        return
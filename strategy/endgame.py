@@ -0,0 +1,185 @@
+"""Exact endgame solver for othello.
+"""
+
+import time
+
+from bitboard import (
+    BOARD_SIZE, bit_to_square, flip_mask, from_array, iterate_bits, legal_moves, popcount,
+)
+from .features import RegionIndex
+from .transposition import EXACT, LANE_MASK, LOWER, UPPER, TranspositionTable
+
+# Masks of the four quadrants, used for parity move ordering.
+QUADRANTS = tuple(
+    sum(1 << (row*BOARD_SIZE + column)
+        for row in range(4*(quadrant//2), 4*(quadrant//2) + 4)
+        for column in range(4*(quadrant%2), 4*(quadrant%2) + 4))
+    for quadrant in range(4)
+)
+QUADRANT_OF = tuple((bit//BOARD_SIZE >= 4)*2 + (bit%BOARD_SIZE >= 4) for bit in range(BOARD_SIZE*BOARD_SIZE))
+
+
+def position_key(player:int, opponent:int):
+    """Plain 64-bit table key of a position.
+    hash() may be negative, which the table would take for a symmetric key.
+    """
+    return hash((player, opponent)) & LANE_MASK
+
+
+class EndgameSolver:
+    """Perfect search of the last empty squares.
+
+    exact : bool
+        If True, search the exact disk differential.
+        Otherwise search only win, loss or draw, which is faster.
+
+    parity : str
+        "region" to prefer moves into odd empty regions, kept by RegionIndex,
+        or "quadrant" to prefer moves into odd quadrants.
+    """
+    # Below this number of empties, moves are ordered by parity only.
+    FASTEST_FIRST_EMPTIES = 7
+    # Below this number of empties, the hash table is not used.
+    TABLE_EMPTIES = 6
+
+    def __init__(self, table_size=2**14, exact=True, parity="quadrant"):
+        self._table = TranspositionTable(table_size)
+        self._exact = exact
+        if parity == "region":
+            self._regions = RegionIndex(0)
+        else:
+            self._regions = None
+        self._nodes = 0
+        self.statistics = {}
+        return
+
+    def final_value(self, player:int, opponent:int):
+        """Disk differential of a finished game seen from player."""
+        difference = popcount(player) - popcount(opponent)
+        if self._exact:
+            return difference
+        return (difference > 0) - (difference < 0)
+
+    def order_moves(self, player:int, opponent:int, moves:int):
+        """Sort moves by fastest-first and parity.
+
+        Returns
+        ----------
+        list of (bit, reversed disks)
+        """
+        empty = ~(player | opponent) & ((1 << BOARD_SIZE*BOARD_SIZE) - 1)
+        fastest_first = popcount(empty) >= self.FASTEST_FIRST_EMPTIES
+        if self._regions is None:
+            odd = [popcount(empty & quadrant) & 1 for quadrant in QUADRANTS]
+
+        ordered = []
+        for bit in iterate_bits(moves):
+            flipped = flip_mask(player, opponent, bit)
+            if fastest_first:
+                mobility = popcount(legal_moves(opponent ^ flipped, player | flipped | (1 << bit)))
+            else:
+                mobility = 0
+            if self._regions is None:
+                parity = odd[QUADRANT_OF[bit]]
+            else:
+                parity = self._regions.parity(bit)
+            ordered.append((mobility, not parity, bit, flipped))
+        ordered.sort()
+        return [(bit, flipped) for _, _, bit, flipped in ordered]
+
+    def search(self, player:int, opponent:int, alpha:int, beta:int, passed=False):
+        """Negamax alpha-beta search to the end of the game.
+
+        Returns
+        ----------
+        evaluation, selected bit
+        """
+        self._nodes += 1
+        moves = legal_moves(player, opponent)
+        if not moves:
+            if passed:
+                return self.final_value(player, opponent), None
+            return -self.search(opponent, player, -beta, -alpha, True)[0], None
+
+        use_table = BOARD_SIZE*BOARD_SIZE - popcount(player | opponent) >= self.TABLE_EMPTIES
+        alpha_origin = alpha
+        if use_table:
+            key = position_key(player, opponent)
+            is_exist, evaluation, stored = self._table.lookup(key, 0, alpha, beta)
+            # Entries keep the whole position, so that positions sharing a key are told apart.
+            if is_exist and stored[1:] == (player, opponent):
+                return evaluation, stored[0]
+
+        max_evaluation = -BOARD_SIZE*BOARD_SIZE - 1
+        selected = None
+        regions = self._regions
+        for index, (bit, flipped) in enumerate(self.order_moves(player, opponent, moves)):
+            next_player = opponent ^ flipped
+            next_opponent = player | flipped | (1 << bit)
+            if regions is not None:
+                regions.fill(bit)
+            if index == 0:
+                evaluation = -self.search(next_player, next_opponent, -beta, -alpha)[0]
+            else:
+                evaluation = -self.search(next_player, next_opponent, -alpha-1, -alpha)[0]
+                if alpha < evaluation < beta:
+                    evaluation = -self.search(next_player, next_opponent, -beta, -evaluation)[0]
+            if regions is not None:
+                regions.unfill()
+            if max_evaluation < evaluation:
+                max_evaluation = evaluation
+                selected = bit
+            if alpha < evaluation:
+                alpha = evaluation
+            if alpha >= beta:
+                break
+
+        if use_table:
+            if max_evaluation <= alpha_origin:
+                bound = UPPER
+            elif max_evaluation >= beta:
+                bound = LOWER
+            else:
+                bound = EXACT
+            self._table.store(key, 0, bound, max_evaluation, (selected, player, opponent))
+        return max_evaluation, selected
+
+    def solve_bits(self, player:int, opponent:int):
+        """Solve a position of bitboards for player.
+
+        Returns
+        ----------
+        evaluation, selected bit
+        """
+        self._nodes = 0
+        self._table.new_search()
+        if self._regions is not None:
+            self._regions.reset(~(player | opponent) & ((1 << BOARD_SIZE*BOARD_SIZE) - 1))
+        if self._exact:
+            return self.search(player, opponent, -BOARD_SIZE*BOARD_SIZE, BOARD_SIZE*BOARD_SIZE)
+        return self.search(player, opponent, -1, 1)
+
+    def solve(self, board, game_turn:int):
+        """Solve a position of the padded board for game_turn.
+
+        Returns
+        ----------
+        evaluation, selected
+            evaluation is the disk differential (or -1, 0, 1) seen from game_turn,
+            and selected is (row, column) or None if game_turn has to pass.
+        """
+        player, opponent = from_array(board, game_turn), from_array(board, game_turn*-1)
+        start = time.perf_counter()
+        evaluation, selected = self.solve_bits(player, opponent)
+        elapsed = time.perf_counter() - start
+
+        self.statistics = {
+            "empties": BOARD_SIZE*BOARD_SIZE - popcount(player | opponent),
+            "evaluation": evaluation,
+            "nodes": self._nodes,
+            "elapsed": elapsed,
+            "table": self._table.statistics(),
+        }
+        if selected is None:
+            return evaluation, None
+        return evaluation, bit_to_square(selected)
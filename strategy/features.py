@@ -0,0 +1,187 @@
+"""Features of a position shared by the strategies.
+
+Features are computed with bit operations on the legal moves cached by
+OthelloGame, so strategies do not generate moves again. features() keeps
+one Features per position of a game, and each feature is computed on its
+first use only.
+"""
+
+from functools import cached_property
+
+from bitboard import (
+    FULL, ORTHOGONAL_SHIFTS, from_array, iterate_bits, neighbours, popcount, square_to_bit,
+)
+
+
+def empty_regions(empty:int):
+    """Split empty squares into regions connected in the four orthogonal directions.
+
+    Returns
+    ----------
+    regions : tuple of int
+        Masks of the regions.
+    """
+    regions = []
+    while empty:
+        region = empty & -empty
+        while True:
+            grown = (region | neighbours(region, ORTHOGONAL_SHIFTS)) & empty
+            if grown == region:
+                break
+            region = grown
+        regions.append(region)
+        empty ^= region
+    return tuple(regions)
+
+
+class RegionIndex:
+    """Empty regions kept up to date while squares are filled.
+
+    Each empty square knows the id of its region, so the size and parity
+    of the region of a square are answered in O(1). fill() splits only the
+    region of the filled square, and unfill() takes back the last fill().
+    """
+
+    def __init__(self, empty:int):
+        self.reset(empty)
+        return
+
+    def reset(self, empty:int):
+        self.empty = empty
+        self._owner = [None]*FULL.bit_length()
+        self._masks = []
+        self._sizes = []
+        self._undo = []
+        for region in empty_regions(empty):
+            self._add(region)
+        return
+
+    def _add(self, region:int):
+        """Register a region under a new id."""
+        index = len(self._masks)
+        self._masks.append(region)
+        self._sizes.append(popcount(region))
+        for bit in iterate_bits(region):
+            self._owner[bit] = index
+        return index
+
+    def size(self, bit:int):
+        """Number of squares of the region containing the empty square bit."""
+        return self._sizes[self._owner[bit]]
+
+    def parity(self, bit:int):
+        """1 if the region containing the empty square bit is odd, otherwise 0."""
+        return self._sizes[self._owner[bit]] & 1
+
+    def region(self, bit:int):
+        return self._masks[self._owner[bit]]
+
+    def fill(self, bit:int):
+        """Fill the empty square bit."""
+        index = self._owner[bit]
+        region = self._masks[index]
+        self.empty ^= 1 << bit
+        self._owner[bit] = None
+        remainder = region ^ (1 << bit)
+        parts = empty_regions(remainder) if remainder else ()
+        self._masks[index] = parts[0] if parts else 0
+        self._sizes[index] = popcount(self._masks[index])
+        for part in parts[1:]:
+            self._add(part)
+        self._undo.append((bit, index, region, len(parts) - 1 if parts else 0))
+        return
+
+    def unfill(self):
+        """Take back the last fill()."""
+        bit, index, region, added = self._undo.pop()
+        for _ in range(added):
+            self._masks.pop()
+            self._sizes.pop()
+        if added:
+            for square in iterate_bits(region):
+                self._owner[square] = index
+        else:
+            self._owner[bit] = index
+        self._masks[index] = region
+        self._sizes[index] = popcount(region)
+        self.empty ^= 1 << bit
+        return
+
+
+class Features:
+    """Features of the position of a game, seen from the side to move.
+
+    moves : dict
+        {(row, column): reversed disks} of legal moves, cached by the game.
+    mobility : int
+        Number of legal moves.
+    potential_mobility : int
+        Number of empty squares next to an opponent disk.
+    frontier : int
+        Number of own disks next to an empty square.
+    opponent_frontier : int
+        Number of opponent disks next to an empty square.
+    regions : RegionIndex
+        Empty regions of the position.
+    """
+
+    def __init__(self, othello, key:tuple):
+        self.key = key
+        self.moves = othello.reversible_area()
+        self.player = from_array(othello.board, othello._game_turn)
+        self.opponent = from_array(othello.board, -othello._game_turn)
+        self.empty = ~(self.player | self.opponent) & FULL
+        return
+
+    @cached_property
+    def mobility(self):
+        return len(self.moves)
+
+    @cached_property
+    def potential_mobility(self):
+        return popcount(neighbours(self.opponent) & self.empty)
+
+    @cached_property
+    def _next_to_empty(self):
+        return neighbours(self.empty)
+
+    @cached_property
+    def frontier(self):
+        return popcount(self.player & self._next_to_empty)
+
+    @cached_property
+    def opponent_frontier(self):
+        return popcount(self.opponent & self._next_to_empty)
+
+    @cached_property
+    def regions(self):
+        return RegionIndex(self.empty)
+
+    def flips(self, move:tuple):
+        """Number of disks reversed by move."""
+        return len(self.moves[move])
+
+    def openness(self, move:tuple):
+        """Number of empty squares next to the disks reversed by move."""
+        return openness(self.moves[move], self.empty)
+
+    def parity(self, move:tuple):
+        """1 if the empty region of move has an odd number of squares, otherwise 0."""
+        return self.regions.parity(square_to_bit(*move))
+
+
+def features(othello):
+    """Return the Features of the position of othello, computed once per position."""
+    key = (othello.board_version, othello._game_turn)
+    cached = getattr(othello, "_features", None)
+    if cached is None or cached.key != key:
+        cached = othello._features = Features(othello, key)
+    return cached
+
+
+def openness(squares:list, empty:int):
+    """Number of empty squares next to squares [(row, column), ...]."""
+    mask = 0
+    for row, column in squares:
+        mask |= 1 << square_to_bit(row, column)
+    return popcount(neighbours(mask) & empty)
@@ -0,0 +1,114 @@
+"""Evaluation kept up to date by make and unmake of a search.
+"""
+
+import numpy as np
+
+from bitboard import BLACK, BOARD_SIZE
+from .pattern import POWERS, SQUARES, SWAPPED, _indices
+
+# Pattern instances and place values of each square of the raveled padded board.
+_SQUARE_PATTERNS = tuple(
+    tuple(
+        (instance, int(POWERS[instance, place]))
+        for instance, place in zip(*np.nonzero((SQUARES == square) & (POWERS > 0)))
+    )
+    for square in range((BOARD_SIZE + 2)**2)
+)
+
+
+class IncrementalEvaluation:
+    """Running evaluation of one board.
+
+    With pattern weights, the pattern indices seen from black and the
+    number of disks are kept. Otherwise the black-minus-white sums of both
+    weight matrices and the number of disks on the border are kept.
+    place() and remove() change them in O(reversed disks), so evaluate()
+    is a read of the running values.
+    Mobility is not kept, because neither evaluation uses it.
+    """
+
+    def __init__(self, first, middle, pattern=None):
+        size = BOARD_SIZE + 2
+        self._first = [0]*size**2
+        self._middle = [0]*size**2
+        self._border = [0]*size**2
+        for row in range(1, BOARD_SIZE + 1):
+            for column in range(1, BOARD_SIZE + 1):
+                square = row*size + column
+                self._first[square] = int(first[row - 1, column - 1])
+                self._middle[square] = int(middle[row - 1, column - 1])
+                self._border[square] = int(row in (1, BOARD_SIZE) or column in (1, BOARD_SIZE))
+        self._pattern = pattern
+        self.board = None
+        return
+
+    def attach(self, board):
+        """Compute the running values of board from scratch."""
+        inner = board[1:-1, 1:-1]
+        cells = board.ravel().tolist()
+        self.board = board
+        self._score_first = sum(weight*cell for weight, cell in zip(self._first, cells) if cell in (1, -1))
+        self._score_middle = sum(weight*cell for weight, cell in zip(self._middle, cells) if cell in (1, -1))
+        self._border_disks = sum(flag for flag, cell in zip(self._border, cells) if cell in (1, -1))
+        self._disks = int(np.count_nonzero(inner))
+        self._indices = _indices(board.take(SQUARES)*BLACK).tolist()
+        return
+
+    def detach(self):
+        self.board = None
+        return
+
+    def place(self, row:int, column:int, reversed_disks:list, game_turn:int):
+        """Update for a disk of game_turn put on (row, column) reversing reversed_disks."""
+        square = row*(BOARD_SIZE + 2) + column
+        self._disks += 1
+        if self._pattern is not None:
+            indices = self._indices
+            # Digits seen from black: 1 for black and 2 for white.
+            digit = 1 if game_turn == BLACK else 2
+            for instance, power in _SQUARE_PATTERNS[square]:
+                indices[instance] += digit*power
+            for x, y in reversed_disks:
+                for instance, power in _SQUARE_PATTERNS[x*(BOARD_SIZE + 2) + y]:
+                    indices[instance] -= power*game_turn
+            return
+        self._score_first += self._first[square]*game_turn
+        self._score_middle += self._middle[square]*game_turn
+        self._border_disks += self._border[square]
+        for x, y in reversed_disks:
+            square = x*(BOARD_SIZE + 2) + y
+            self._score_first += 2*self._first[square]*game_turn
+            self._score_middle += 2*self._middle[square]*game_turn
+        return
+
+    def remove(self, row:int, column:int, reversed_disks:list, game_turn:int):
+        """Take back place() with the same arguments."""
+        square = row*(BOARD_SIZE + 2) + column
+        self._disks -= 1
+        if self._pattern is not None:
+            indices = self._indices
+            digit = 1 if game_turn == BLACK else 2
+            for instance, power in _SQUARE_PATTERNS[square]:
+                indices[instance] -= digit*power
+            for x, y in reversed_disks:
+                for instance, power in _SQUARE_PATTERNS[x*(BOARD_SIZE + 2) + y]:
+                    indices[instance] += power*game_turn
+            return
+        self._score_first -= self._first[square]*game_turn
+        self._score_middle -= self._middle[square]*game_turn
+        self._border_disks -= self._border[square]
+        for x, y in reversed_disks:
+            square = x*(BOARD_SIZE + 2) + y
+            self._score_first -= 2*self._first[square]*game_turn
+            self._score_middle -= 2*self._middle[square]*game_turn
+        return
+
+    def evaluate(self, game_turn:int):
+        """Evaluation of the attached board seen from game_turn."""
+        if self._pattern is not None:
+            if game_turn == BLACK:
+                return self._pattern.evaluate_indices(self._indices, self._disks)
+            return self._pattern.evaluate_indices(SWAPPED.take(self._indices), self._disks)
+        if self._border_disks:
+            return self._score_middle*game_turn
+        return self._score_first*game_turn
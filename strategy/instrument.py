@@ -0,0 +1,116 @@
+"""Counters and timers of the min-max search.
+
+Minmax(instrument=True) fills a SearchStats during each search and
+publishes its summary in statistics["instrument"]. Without it, the search
+only pays one attribute test per node and per cutoff.
+"""
+
+import cProfile
+import json
+import time
+
+
+class SearchStats:
+    """Nodes and cutoffs by ply from the root, and time spent in wrapped functions."""
+
+    def __init__(self):
+        self._timings = {}
+        self._calls = {}
+        self.reset()
+        return
+
+    def reset(self):
+        self.nodes = []
+        self.cutoffs = []
+        self.first_cutoffs = 0
+        for name in self._timings:
+            self._timings[name] = 0.0
+            self._calls[name] = 0
+        return
+
+    def node(self, ply:int):
+        """Count a node at ply."""
+        while len(self.nodes) <= ply:
+            self.nodes.append(0)
+            self.cutoffs.append(0)
+        self.nodes[ply] += 1
+        return
+
+    def cutoff(self, ply:int, index:int):
+        """Count a beta cutoff at ply by the index-th searched move."""
+        self.cutoffs[ply] += 1
+        if index == 0:
+            self.first_cutoffs += 1
+        return
+
+    def timed(self, name:str, function):
+        """Wrap function so that its calls and their time are counted under name."""
+        self._timings[name] = 0.0
+        self._calls[name] = 0
+        timings, calls = self._timings, self._calls
+        clock = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings[name] += clock() - start
+                calls[name] += 1
+        return wrapper
+
+    def branching_factor(self):
+        """Effective branching factor: the n-th root of the nodes of a search n plies deep."""
+        depth = len(self.nodes) - 1
+        if depth < 1:
+            return 0.0
+        return sum(self.nodes)**(1/depth)
+
+    def summary(self):
+        """Return the counters as a JSON-serializable dict."""
+        cutoffs = sum(self.cutoffs)
+        return {
+            "nodes": list(self.nodes),
+            "cutoffs": list(self.cutoffs),
+            "branching_factor": self.branching_factor(),
+            "first_move_cutoff_rate": self.first_cutoffs/cutoffs if cutoffs else 0.0,
+            "timings": {
+                name: {"calls": self._calls[name], "seconds": self._timings[name]}
+                for name in self._timings
+            },
+        }
+
+
+class SearchLog:
+    """Append one JSON line per move to path."""
+
+    def __init__(self, path:str):
+        self._path = path
+        return
+
+    def write(self, record:dict):
+        with open(self._path, "a") as file_:
+            file_.write(json.dumps(record) + "\n")
+        return
+
+
+class SearchProfile:
+    """cProfile of the searches of a game, dumped to path after each move.
+
+    The dump is in the pstats format, readable by pstats, snakeviz or
+    flameprof to draw a flame graph.
+    """
+
+    def __init__(self, path:str):
+        self._path = path
+        self._profile = cProfile.Profile()
+        return
+
+    def enable(self):
+        self._profile.enable()
+        return
+
+    def disable(self):
+        self._profile.disable()
+        self._profile.dump_stats(self._path)
+        return
@@ -3,6 +3,8 @@
 
 import random
 
+from .features import features
+
 
 class Maximize:
     """Put disk to maximize number of one's disks."""
@@ -13,10 +15,12 @@ class Maximize:
         """Put disk to maximize number of one's disks."""
         max_strategy = []
         max_merit = 0
-        for candidate in othello.reversible.keys():
-            if max_merit < len(othello.reversible[candidate]):
+        position = features(othello)
+        for candidate in position.moves:
+            flips = position.flips(candidate)
+            if max_merit < flips:
                 max_strategy = [candidate]
-                max_merit = len(othello.reversible[candidate])
-            elif max_merit == len(othello.reversible[candidate]):
+                max_merit = flips
+            elif max_merit == flips:
                 max_strategy.append(candidate)
-        return random.choice(max_strategy)
\ No newline at end of file
+        return random.choice(max_strategy)
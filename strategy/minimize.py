@@ -3,6 +3,8 @@
 
 import random
 
+from .features import features
+
 
 class Minimize:
     """Put disk to minimize number of one's disks."""
@@ -13,10 +15,12 @@ class Minimize:
         """Put disk to minimize number of one's disks."""
         min_strategy = []
         min_merit = float('inf')
-        for candidate in othello.reversible.keys():
-            if min_merit > len(othello.reversible[candidate]):
+        position = features(othello)
+        for candidate in position.moves:
+            flips = position.flips(candidate)
+            if min_merit > flips:
                 min_strategy = [candidate]
-                min_merit = len(othello.reversible[candidate])
-            elif min_merit == len(othello.reversible[candidate]):
+                min_merit = flips
+            elif min_merit == flips:
                 min_strategy.append(candidate)
-        return random.choice(min_strategy)
\ No newline at end of file
+        return random.choice(min_strategy)
@@ -1,31 +1,148 @@
 """Various strategies for othello.
 """
 
-from collections import deque
-import copy
 import numpy as np
-import pickle
-import random
+import sys
+import time
 
+from bitboard import BitBoard
 from othello import OthelloGame
+from rays import ArrayBoard
+from .book import DEFAULT_BOOK, OpeningBook
+from .cache import DiskCache
+from .endgame import EndgameSolver
+from .incremental import IncrementalEvaluation
+from .instrument import SearchLog, SearchProfile, SearchStats
+from .parallel import RootSplitter
+from .pattern import SYMMETRIC, PatternEvaluation
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable, Zobrist
+
+class SearchTimeout(Exception):
+    """Raised inside min_max when the time budget of a move is exhausted."""
+
+
+class SearchCancelled(Exception):
+    """Raised inside min_max when the search was cancelled from another thread."""
+
 
 class Minmax:
     """Find a better move by min-max method.
+
+    time_limit : float or None
+        Time budget per move in seconds. If given, put_disk deepens iteratively
+        and returns the best move of the deepest completed iteration.
+        Otherwise put_disk searches to a fixed depth.
+
+    endgame_empties : int or None
+        With this number of empty squares or fewer, the position is solved
+        perfectly by EndgameSolver instead of the min-max search.
+
+    endgame_exact : bool
+        If True, the endgame solver searches the exact disk differential.
+        Otherwise it searches only win, loss or draw.
+
+    workers : int
+        Number of processes of the fixed-depth search.
+        If more than 1, root moves are searched in parallel.
+
+    book : str or None
+        Path of the opening book. While the position is in book,
+        the book move is returned without search.
+
+    cache : str or None
+        Path of the on-disk transposition cache. Nodes of cache_depth or deeper
+        missing from the table are looked up there, and update_file() writes them back.
+
+    cache_readonly : bool
+        If True, the cache is shared read-only, e.g. by several processes.
+
+    evaluation : str
+        "pattern" for trained pattern weights, or "matrix" for the static weight matrices.
+        Without the weight file, the matrices are used.
+
+    symmetry_disks : int
+        Searches from positions with this many disks or fewer use symmetric keys,
+        so that the table and the cache share entries between rotated and
+        reflected copies of a position. Such copies are common only in the opening.
+        0 disables them. They are disabled as well if the evaluation is not
+        the same on symmetric copies, since shared entries would be wrong.
+
+    instrument : bool
+        If True, each search counts nodes and cutoffs by ply and times
+        reversible_area, evaluate_value and hashing. The summary is
+        statistics["instrument"] after each move.
+
+    instrument_log : str or None
+        Path of a JSONL file to which the statistics of each move are appended.
+        Implies instrument.
+
+    profile : str or None
+        Path of a cProfile dump of all searches, rewritten after each move.
     """
     __all__ = ["put_disk"]
 
-    def __init__(self):
-        try:
-            with open('./non_bit_othello/strategy/minmax_hash.pkl', 'rb') as file_:
-                self._hash_log = pickle.load(file_)
-        except:
-            self._hash_log = {}
-        for color in ["1", "-1"]:
-            for turn in ['1', '-1']:
-                for depth in ["0", "1", "2", "3", "4", "5"]:
-                    key = "".join([color, turn, depth])
-                    if key not in self._hash_log.keys():
-                        self._hash_log[key] = {}
+    WIN = 10**10
+
+    def __init__(self, backend="array", table_size=2**16, time_limit=None, endgame_empties=10, endgame_exact=True, workers=1, book=DEFAULT_BOOK, cache=None, cache_depth=3, cache_readonly=False, evaluation="pattern", symmetry_disks=16, instrument=False, instrument_log=None, profile=None):
+        # Backend of move generation: "array" walks precomputed rays over the board,
+        # "bitboard" generates moves from masks. The ray walk is about twice as fast here.
+        if backend == "bitboard":
+            self._backend = BitBoard()
+        else:
+            self._backend = ArrayBoard()
+
+        # Zobrist keys and a transposition table of bounded size
+        self._plain_zobrist = Zobrist()
+        self._symmetric_zobrist = Zobrist(symmetric=True)
+        self._symmetry_disks = symmetry_disks
+        self._zobrist = self._plain_zobrist
+        self._table = TranspositionTable(table_size)
+        self.statistics = {}
+        self._time_limit = time_limit
+        self._deadline = None
+        self._cancelled = False
+        self._depth = 0
+        self._nodes = 0
+        self._start = time.perf_counter()
+
+        # Perfect search of the last empties
+        self._endgame_empties = endgame_empties
+        if endgame_empties is not None:
+            self._endgame = EndgameSolver(exact=endgame_exact)
+        else:
+            self._endgame = None
+
+        # Move ordering
+        self._killers = []
+        self._history = {}
+
+        # Opening book, mapped on first lookup
+        if book is not None:
+            self._book = OpeningBook(book)
+        else:
+            self._book = None
+
+        # Transposition cache on disk, mapped lazily
+        self._cache_depth = cache_depth
+        if cache is not None:
+            self._cache = DiskCache(cache, readonly=cache_readonly)
+        else:
+            self._cache = None
+
+        # Evaluation of leaves
+        self._pattern = PatternEvaluation()
+        if evaluation != "pattern" or not self._pattern.load():
+            self._pattern = None
+
+        # Parallel search of root moves
+        if workers > 1:
+            self._splitter = RootSplitter(workers, {
+                "backend": backend, "table_size": table_size, "evaluation": evaluation,
+                "cache": cache, "cache_depth": cache_depth, "cache_readonly": True,
+                "symmetry_disks": symmetry_disks,
+            })
+        else:
+            self._splitter = None
 
         self._EVALUATION_FIRST = np.array([
             [ 30,-12,  0, -1, -1,  0,-12, 30],
@@ -47,13 +164,26 @@ class Minmax:
             [-20,-40, -5, -5, -5, -5,-40,-20],
             [120,-20, 20,  5,  5, 20,-20,120],
         ])
-        return
+        if not self.symmetric_evaluation():
+            self._symmetry_disks = 0
 
-    def hashing(self, board):
-        hashed_board = [None for _ in range(len(board))]
-        for row in range(len(board)):
-            hashed_board[row] = "".join(map(str, board[row]))
-        return "".join(hashed_board)
+        # Evaluation updated by make_move and unmake_move
+        self._incremental = IncrementalEvaluation(self._EVALUATION_FIRST, self._EVALUATION_MIDDLE, self._pattern)
+
+        # Instrumentation, off by default. Timed functions are wrapped per instance,
+        # so that the search is unchanged without it.
+        self._log = SearchLog(instrument_log) if instrument_log is not None else None
+        if instrument or self._log is not None:
+            self._stats = SearchStats()
+            self.reversible_area = self._stats.timed("reversible_area", self.reversible_area)
+            self.evaluate_value = self._stats.timed("evaluate_value", self.evaluate_value)
+            for zobrist in (self._plain_zobrist, self._symmetric_zobrist):
+                zobrist.hashing = self._stats.timed("hashing", zobrist.hashing)
+                zobrist.update = self._stats.timed("hashing", zobrist.update)
+        else:
+            self._stats = None
+        self._profile = SearchProfile(profile) if profile is not None else None
+        return
 
     def count_disks(self, board:list, player_color:int):
         """Count number of black and white disks and number of blank squares.
@@ -61,88 +191,43 @@ class Minmax:
         ----------
         count_player, count_CPU, count_blank = int
         """
-        return np.count_nonzero(board==player_color), np.count_nonzero(board==player_color*-1), np.count_nonzero(board==OthelloGame.BLANK)
+        return self._backend.count_disks(board, player_color)
 
     def reversible_area(self, board:list, game_turn:int):
         """Select reversible area."""
-        reversible = {}
-        dx = (-1, 0, 1)
-        dy = (-1, 0, 1)
-        for row in range(1, OthelloGame.BOARD_SIZE+1):
-            for column in range(1, OthelloGame.BOARD_SIZE+1):
-                if board[row, column] != 0:
-                    continue
-                for x in dx:
-                    for y in dy:
-                        if game_turn+board[row+x,column+y] == 0:
-                            coefficient = 2
-                            while True:
-                                if board[row+x*coefficient, column+y*coefficient] == game_turn:
-                                    if (row, column) not in reversible.keys():
-                                        reversible[(row, column)] = []
-                                    for coefficient_ in range(1, coefficient):
-                                        reversible[(row, column)].append((row+x*coefficient_, column+y*coefficient_))
-                                    break
-                                elif board[row+x*coefficient, column+y*coefficient] == game_turn*-1:
-                                    pass
-                                else:
-                                    break
-                                coefficient += 1
-        return reversible
+        return self._backend.reversible_area(board, game_turn)
 
     def is_reversible(self, reversible:dict, row:int, column:int):
         """Return wheather you can put disk on (x,y) or not."""
         return (row, column) in reversible.keys()
 
-    def reverse(self, board:list, reversible:dict, row:int, column:int, game_turn:int):
-        """Put a disk and reverse disks."""
-        new_board = copy.deepcopy(board)
-        new_board[row, column] = game_turn
-        for x, y in reversible[(row, column)]:
-            new_board[x, y] *= -1
-        return new_board
+    def make_move(self, board:list, reversible:dict, row:int, column:int, game_turn:int):
+        """Put a disk and reverse disks in place.
+        Reversed disks are pushed on the undo stack.
+        """
+        reversed_disks = reversible[(row, column)]
+        if self._incremental.board is not board:
+            self._incremental.attach(board)
+        self._incremental.place(row, column, reversed_disks, game_turn)
+        board[row, column] = game_turn
+        for x, y in reversed_disks:
+            board[x, y] *= -1
+        self._undo_stack.append((row, column, reversed_disks))
+        return board
+
+    def unmake_move(self, board:list):
+        """Take back the last move of make_move."""
+        row, column, reversed_disks = self._undo_stack.pop()
+        self._incremental.remove(row, column, reversed_disks, int(board[row, column]))
+        board[row, column] = OthelloGame.BLANK
+        for x, y in reversed_disks:
+            board[x, y] *= -1
+        return board
 
     def turn_playable(self, reversible:dict):
         """Return wheather you can put disk or not."""
         return reversible != {}
 
-    def process_game(self):
-        self.reversible_area()
-        if self._game_turn == self._player_color:
-            if self.turn_playable():
-                if self.user_auto:
-                    pass
-                else:
-                    pass
-            else:
-                self.change_turn()
-                self._count_pass += 1
-        else:
-            if self.turn_playable():
-                self.reverse(*self.choice_CPU())
-                self.change_turn()
-                self._count_pass = 0
-            else:
-                self.change_turn()
-                self._count_pass += 1
-            self.log_turn()
-        if self.game_judgement():
-            return True
-        else:
-            return False
-
-    def game_judgement(self, count_player:int, count_CPU:int, count_blank:int):
-        """Judgement of game."""
-        if self._count_pass >= 2 or count_blank == 0:
-            if count_player == count_CPU:
-                self._result = "DRAW"
-            if count_player > count_CPU:
-                self._result = "WIN"
-            if count_player < count_CPU:
-                self._result = "LOSE"
-            return True
-        return False
-
     def touch_border(self, board:list):
         if np.count_nonzero(board[[1, -2], 1:-1] != 0):
             return True
@@ -151,91 +236,298 @@ class Minmax:
         return False
 
     def evaluate_value(self, board:list, game_turn:int):
+        if self._incremental.board is board:
+            return self._incremental.evaluate(game_turn)
+        if self._pattern is not None:
+            return self._pattern.evaluate(board, game_turn)
         if not self.touch_border(board):
-            return np.sum(self._EVALUATION_FIRST*board[1:-1,1:-1])*game_turn
+            return int(np.sum(self._EVALUATION_FIRST*board[1:-1,1:-1]))*game_turn
         else:
-            return np.sum(self._EVALUATION_MIDDLE*board[1:-1,1:-1])*game_turn
+            return int(np.sum(self._EVALUATION_MIDDLE*board[1:-1,1:-1]))*game_turn
 
-    def check_hash_table(self, hashed_board, key):
-        if hashed_board in self._hash_log[key].keys():
-            return True, self._hash_log[key][hashed_board]
-        return False, None
+    def symmetric_evaluation(self):
+        """Return wheather evaluate_value is the same on the 8 symmetric copies of a position."""
+        if self._pattern is not None:
+            return SYMMETRIC
+        return all(
+            np.array_equal(matrix, np.rot90(matrix)) and np.array_equal(matrix, matrix.T)
+            for matrix in (self._EVALUATION_FIRST, self._EVALUATION_MIDDLE)
+            )
 
-    def save_hash_table(self, hashed_board, key, evaluation, selected):
-        self._hash_log[key][hashed_board] = (evaluation, selected)
+    def update_file(self):
+        """Write entries of cache_depth or deeper from the table to the disk cache."""
+        if self._cache is None:
+            return
+        for key, depth, bound, evaluation, selected, _ in self._table.entries():
+            if depth >= self._cache_depth:
+                self._cache.store(key, depth, bound, evaluation, selected)
+        self._cache.flush()
         return
 
-    def update_file(self):
-        with open('./non_bit_othello/strategy/minmax_hash.pkl', 'wb') as file_:
-            pickle.dump(self._hash_log, file_)
+    def final_value(self, board:list, game_turn:int):
+        """Evaluation of a finished game seen from game_turn."""
+        count_player, count_CPU, _ = self.count_disks(board, game_turn)
+        if count_player > count_CPU:
+            return self.WIN
+        if count_player < count_CPU:
+            return -self.WIN
+        return 0
+
+    def order_moves(self, reversible:dict, tt_move, ply:int):
+        """Sort candidates by TT best move, killer moves, history and static square value."""
+        killers = self._killers[ply] if ply < len(self._killers) else ()
+
+        def priority(move):
+            if move == tt_move:
+                return 1 << 40
+            if move in killers:
+                return (1 << 30) - killers.index(move)
+            return self._history.get(move, 0) + self._EVALUATION_MIDDLE[move[0]-1, move[1]-1]
+        return sorted(reversible.keys(), key=priority, reverse=True)
+
+    def save_cutoff(self, move, depth:int, ply:int):
+        """Remember a move which caused a beta cutoff."""
+        while len(self._killers) <= ply:
+            self._killers.append([])
+        killers = self._killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        self._history[move] = self._history.get(move, 0) + depth*depth
         return
 
-    def min_max(self, board, game_turn, depth, pre_evaluation=-1*float('inf')):
+    def min_max(self, board, game_turn, depth, key, alpha=-1*float('inf'), beta=float('inf'), ply=0, passed=False):
+        """Negamax alpha-beta search with principal-variation search.
+        Evaluations are seen from game_turn.
+
+        Returns
+        ----------
+        evaluation, selected
+        """
+        self._nodes += 1
+        if self._stats is not None:
+            self._stats.node(ply)
+        if not self._nodes & 0xFF:
+            if self._cancelled:
+                raise SearchCancelled
+            if self._deadline is not None and time.perf_counter() > self._deadline:
+                raise SearchTimeout
+        alpha_origin = alpha
+
         # If the board is known, return value.
-        hashed_board = self.hashing(board)
-        hash_key = "".join([str(self._player_color) + str(game_turn) + str(depth)])
-        is_exist, saved = self.check_hash_table(hashed_board, hash_key)
+        is_exist, evaluation, tt_move = self._table.lookup(key, depth, alpha, beta)
         if is_exist:
-            evaluation, selected = saved
-            return evaluation, selected
+            return evaluation, tt_move
+        if self._cache is not None and depth >= self._cache_depth:
+            is_exist, evaluation, cache_move = self._cache.lookup(key, depth, alpha, beta)
+            if is_exist:
+                return evaluation, cache_move
+            if tt_move is None:
+                tt_move = cache_move
 
-        # Calculate evaluation.
-        evaluation = self.evaluate_value(board, self._player_color)
         if depth == 0:
-            self.save_hash_table(hashed_board, hash_key, evaluation, (1,1))
-            return evaluation, (1,1)
-
-        if game_turn == self._player_color:
-            max_evaluation = -1*float('inf')
-        else:
-            min_evaluation = float('inf')
+            evaluation = self.evaluate_value(board, game_turn)
+            self._table.store(key, depth, EXACT, evaluation, None)
+            return evaluation, None
 
         reversible = self.reversible_area(board, game_turn)
-        if self.turn_playable(reversible):
-            for (row, column) in reversible.keys():
-                new_board = self.reverse(board, reversible, row, column, game_turn)
-                if self.game_judgement(*self.count_disks(new_board, game_turn)):
-                    if self._result == 'WIN':
-                        next_evaluation = 10**10
-                    elif self._result == 'LOSE':
-                        next_evaluation = -10**10
-                    else:
-                        next_evaluation = 0
-                else:
-                    if game_turn == self._player_color:
-                        next_evaluation = self.min_max(new_board, game_turn*-1, depth-1, max_evaluation)[0]
-                    else:
-                        next_evaluation = self.min_max(new_board, game_turn*-1, depth-1, min_evaluation)[0]
-
-                # alpha-bata method(pruning)
-                if game_turn == self._player_color:
-                    if next_evaluation < pre_evaluation:
-                        return next_evaluation, (row, column)
-                else:
-                    if pre_evaluation < next_evaluation:
-                        return next_evaluation, (row, column)
-                    pass
-
-                if game_turn == self._player_color:
-                    if max_evaluation < next_evaluation:
-                        max_evaluation = next_evaluation
-                        selected = (row, column)
-                else:
-                    if next_evaluation < min_evaluation:
-                        min_evaluation = next_evaluation
-                        selected = (row, column)
+        if not self.turn_playable(reversible):
+            if passed:
+                evaluation = self.final_value(board, game_turn)
+                self._table.store(key, depth, EXACT, evaluation, None)
+                return evaluation, None
+            evaluation = -self.min_max(board, game_turn*-1, depth, key ^ self._zobrist.TURN, -beta, -alpha, ply+1, True)[0]
+            return evaluation, None
+
+        max_evaluation = -1*float('inf')
+        selected = None
+        for index, (row, column) in enumerate(self.order_moves(reversible, tt_move, ply)):
+            self.make_move(board, reversible, row, column, game_turn)
+            new_key = self._zobrist.update(key, row, column, reversible[(row, column)], game_turn)
+            if index == 0:
+                next_evaluation = -self.min_max(board, game_turn*-1, depth-1, new_key, -beta, -alpha, ply+1)[0]
+            else:
+                # Null window search, re-searched only when the move may be better.
+                next_evaluation = -self.min_max(board, game_turn*-1, depth-1, new_key, -alpha-1, -alpha, ply+1)[0]
+                if alpha < next_evaluation < beta:
+                    next_evaluation = -self.min_max(board, game_turn*-1, depth-1, new_key, -beta, -next_evaluation, ply+1)[0]
+            self.unmake_move(board)
+
+            if max_evaluation < next_evaluation:
+                max_evaluation = next_evaluation
+                selected = (row, column)
+            if alpha < next_evaluation:
+                alpha = next_evaluation
+            # alpha-beta method(pruning)
+            if alpha >= beta:
+                self.save_cutoff((row, column), depth, ply)
+                if self._stats is not None:
+                    self._stats.cutoff(ply, index)
+                break
+
+        if max_evaluation <= alpha_origin:
+            bound = UPPER
+        elif max_evaluation >= beta:
+            bound = LOWER
         else:
-            return self.min_max(board, game_turn*-1, depth-1)
-        if game_turn == self._player_color:
-            self.save_hash_table(hashed_board, hash_key, max_evaluation, selected)
-            return max_evaluation, selected
+            bound = EXACT
+        self._table.store(key, depth, bound, max_evaluation, selected)
+        return max_evaluation, selected
+
+    def iterative_deepening(self, board, game_turn:int, key:int, max_depth:int, start:float):
+        """Deepen the search until the time budget runs out.
+
+        Returns
+        ----------
+        selected, reached_depth
+        """
+        selected, reached_depth = None, 0
+        for depth in range(1, max_depth+1):
+            # The first iteration always completes, so that a move is available.
+            self._deadline = start + self._time_limit if depth > 1 else None
+            self._depth = depth
+            try:
+                evaluation, selected = self.min_max(board, game_turn, depth, key)
+            except SearchTimeout:
+                while self._undo_stack:
+                    self.unmake_move(board)
+                break
+            finally:
+                self._deadline = None
+            reached_depth = depth
+
+            # The next iteration would hardly complete, or the result is already decided.
+            if time.perf_counter() - start > self._time_limit/2 or abs(evaluation) >= self.WIN:
+                break
+        return selected, reached_depth
+
+    def set_time_limit(self, time_limit):
+        """Change the time budget per move. None searches to a fixed depth."""
+        self._time_limit = time_limit
+        return
+
+    def cancel(self):
+        """Stop a running put_disk, which then returns None.
+        It can be called from another thread.
+        """
+        self._cancelled = True
+        return
+
+    def clear_cancel(self):
+        """Allow the next put_disk to run."""
+        self._cancelled = False
+        return
+
+    def progress(self):
+        """Return depth, node count and elapsed time of the running search."""
+        return {
+            "depth": self._depth,
+            "nodes": self._nodes,
+            "elapsed": time.perf_counter() - self._start,
+        }
+
+    def select_keys(self, board):
+        """Choose symmetric or plain Zobrist keys for a search from board."""
+        disks = OthelloGame.BOARD_SIZE**2 - self.count_disks(board, OthelloGame.BLACK)[2]
+        if disks <= self._symmetry_disks:
+            self._zobrist = self._symmetric_zobrist
         else:
-            self.save_hash_table(hashed_board, hash_key, min_evaluation, selected)
-            return min_evaluation, selected
+            self._zobrist = self._plain_zobrist
+        return
+
+    def prepare_search(self):
+        """Reset counters and move ordering for a new search."""
+        self._undo_stack = []
+        self._incremental.detach()
+        self._nodes = 0
+        self._start = time.perf_counter()
+
+        # Killer moves are indexed by ply from the root, and history decays between searches.
+        self._killers = []
+        self._history = {move: value//2 for move, value in self._history.items() if value > 1}
+        self._table.new_search()
+        if self._stats is not None:
+            self._stats.reset()
+        return
+
+    def close(self):
+        """Stop worker processes of the parallel search and unmap the cache."""
+        if self._splitter is not None:
+            self._splitter.shutdown()
+        if self._cache is not None:
+            self._cache.close()
+        return
 
     def put_disk(self, othello, depth=5):
-        board = copy.deepcopy(othello.board)
+        # The only board allocated by a search; children are made and unmade in place.
+        board = othello.board.copy()
+        self.prepare_search()
+        # Statistics describe this move only, whichever path returns it.
+        self.statistics = {}
+        self._depth = depth
+        start = self._start
         game_turn = othello._game_turn
         self._player_color = othello._game_turn
-        self._count_pass = 0
-        return self.min_max(board, game_turn, depth)[1]
\ No newline at end of file
+
+        if self._book is not None:
+            found = self._book.lookup(board, game_turn)
+            if found is not None:
+                self.statistics["book"] = {"evaluation": found[0]}
+                self.statistics["table"] = self._table.statistics()
+                self.statistics["search"] = {"depth": 0, "nodes": 0, "elapsed": time.perf_counter() - start}
+                return found[1]
+
+        count_blank = self.count_disks(board, game_turn)[2]
+        if self._endgame is not None and count_blank <= self._endgame_empties:
+            selected = self._endgame.solve(board, game_turn)[1]
+            self.statistics["endgame"] = self._endgame.statistics
+            self.statistics["table"] = self._table.statistics()
+            self.statistics["search"] = {
+                "depth": count_blank,
+                "nodes": self._endgame.statistics["nodes"],
+                "elapsed": self._endgame.statistics["elapsed"],
+            }
+            return selected
+
+        if self._profile is not None:
+            self._profile.enable()
+        self.select_keys(board)
+        key = self._zobrist.hashing(board, game_turn)
+        # Memory blocks held by the interpreter, to count what the search leaves allocated per node.
+        blocks = sys.getallocatedblocks()
+        try:
+            if self._time_limit is None and self._splitter is not None:
+                selected = self._splitter.search(self, board, game_turn, depth, key)[1]
+                if selected is None:
+                    return None
+            elif self._time_limit is None:
+                selected = self.min_max(board, game_turn, depth, key)[1]
+            else:
+                selected, depth = self.iterative_deepening(board, game_turn, key, count_blank, start)
+        except SearchCancelled:
+            return None
+        finally:
+            if self._profile is not None:
+                self._profile.disable()
+        elapsed = time.perf_counter() - start
+        blocks = sys.getallocatedblocks() - blocks
+
+        self.statistics["table"] = self._table.statistics()
+        self.statistics["search"] = {
+            "depth": depth,
+            "nodes": self._nodes,
+            "elapsed": elapsed,
+            "nodes_per_second": self._nodes/elapsed if elapsed else 0.0,
+            "allocated_blocks": blocks,
+            "allocations_per_node": blocks/self._nodes if self._nodes else 0.0,
+        }
+        if self._stats is not None:
+            self.statistics["instrument"] = self._stats.summary()
+            if self._log is not None:
+                self._log.write({
+                    "move": list(selected) if selected is not None else None,
+                    "search": self.statistics["search"],
+                    "table": self.statistics["table"],
+                    "instrument": self.statistics["instrument"],
+                })
+        return selected
\ No newline at end of file
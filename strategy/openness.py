@@ -1,10 +1,9 @@
 """Various strategies for othello.
 """
 
-import copy
 import random
 
-from othello import OthelloGame
+from .features import features
 
 class Openness:
     """Put disk based on openness theory."""
@@ -13,22 +12,15 @@ class Openness:
 
     def put_disk(self, othello):
         """Put disk based on openness theory."""
+        position = features(othello)
         min_strategy = []
         min_openness = float('inf')
-        dx = (-1, 0, 1)
-        dy = (-1, 0, 1)
 
-        for candidate in othello.reversible.keys():
-            set_openness = []
-            for return_disk in othello.reversible[candidate]:
-                for x in dx:
-                    for y in dy:
-                        if othello.board[return_disk[0]+x, return_disk[1]+y] == OthelloGame.BLANK:
-                            if (return_disk[0]+x, return_disk[1]+y) not in set_openness:
-                                set_openness.append((return_disk[0]+x, return_disk[1]+y))
-            if len(set_openness) < min_openness:
-                min_openness = len(set_openness)
+        for candidate in position.moves:
+            candidate_openness = position.openness(candidate)
+            if candidate_openness < min_openness:
+                min_openness = candidate_openness
                 min_strategy = [candidate]
-            elif len(set_openness) == min_openness:
+            elif candidate_openness == min_openness:
                 min_strategy.append(candidate)
-        return random.choice(min_strategy)
\ No newline at end of file
+        return random.choice(min_strategy)
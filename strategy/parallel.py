@@ -0,0 +1,122 @@
+"""Parallel root-split search for Minmax.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+
+# State of a worker process.
+_WORKER = {"minmax": None, "alpha": None, "search_id": None}
+
+
+def _init_worker(alpha, options:dict):
+    from .minmax import Minmax
+    _WORKER["minmax"] = Minmax(endgame_empties=None, **options)
+    _WORKER["alpha"] = alpha
+    return
+
+
+def _search_root_move(board, game_turn:int, depth:int, row:int, column:int, search_id:int):
+    """Search one root move in a worker process.
+
+    The move is searched with the window (alpha-1, inf) seen from the root,
+    where alpha is the best evaluation shared by the other workers.
+    The evaluation is exact if it is alpha or more, otherwise an upper bound.
+
+    Returns
+    ----------
+    evaluation, nodes
+    """
+    minmax = _WORKER["minmax"]
+    shared_alpha = _WORKER["alpha"]
+    # Entries of the previous search are dropped, so that results do not depend on the history of a worker.
+    if _WORKER["search_id"] != search_id:
+        minmax._table.clear()
+        _WORKER["search_id"] = search_id
+    minmax.prepare_search()
+
+    reversible = minmax.reversible_area(board, game_turn)
+    minmax.select_keys(board)
+    minmax.make_move(board, reversible, row, column, game_turn)
+    key = minmax._zobrist.hashing(board, game_turn*-1)
+    alpha = shared_alpha.value
+    evaluation = -minmax.min_max(board, game_turn*-1, depth-1, key, -1*float('inf'), -(alpha-1), 1)[0]
+
+    with shared_alpha.get_lock():
+        if shared_alpha.value < evaluation:
+            shared_alpha.value = evaluation
+    return evaluation, minmax._nodes
+
+
+class RootSplitter:
+    """Spread root moves over a pool of processes.
+
+    The first move is searched in the calling process to establish alpha,
+    and the younger brothers are searched in parallel with the shared alpha.
+    With the same move ordering, the selected move is the same as the serial search.
+    """
+
+    def __init__(self, workers:int, options:dict):
+        self._workers = workers
+        self._options = options
+        self._executor = None
+        self._alpha = None
+        self._search_id = 0
+        return
+
+    def executor(self):
+        if self._executor is None:
+            self._alpha = multiprocessing.Value("d", -1*float('inf'))
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers, initializer=_init_worker, initargs=(self._alpha, self._options),
+                )
+        return self._executor
+
+    def search(self, minmax, board, game_turn:int, depth:int, key:int):
+        """Search the root position.
+
+        Returns
+        ----------
+        evaluation, selected
+            selected is None if the search was cancelled.
+        """
+        executor = self.executor()
+        self._search_id += 1
+        reversible = minmax.reversible_area(board, game_turn)
+        tt_move = minmax._table.lookup(key, depth, -1*float('inf'), float('inf'))[2]
+        moves = minmax.order_moves(reversible, tt_move, 0)
+
+        # The eldest brother
+        row, column = moves[0]
+        minmax.make_move(board, reversible, row, column, game_turn)
+        new_key = minmax._zobrist.update(key, row, column, reversible[(row, column)], game_turn)
+        evaluation = -minmax.min_max(board, game_turn*-1, depth-1, new_key, ply=1)[0]
+        minmax.unmake_move(board)
+        self._alpha.value = evaluation
+
+        # Younger brothers
+        futures = {
+            executor.submit(_search_root_move, board, game_turn, depth, row, column, self._search_id): index
+            for index, (row, column) in enumerate(moves[1:], 1)
+        }
+        results = [(evaluation, 0)]
+        pending = set(futures)
+        while pending:
+            finished, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            for future in finished:
+                next_evaluation, nodes = future.result()
+                minmax._nodes += nodes
+                results.append((next_evaluation, futures[future]))
+            if minmax._cancelled:
+                for future in pending:
+                    future.cancel()
+                return None, None
+
+        # The highest evaluation, and the eldest one among equals as the serial search does.
+        evaluation, index = max(results, key=lambda result: (result[0], -result[1]))
+        return evaluation, moves[index]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        return
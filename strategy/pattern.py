@@ -0,0 +1,353 @@
+"""Pattern-based evaluation of othello.
+
+A position is scored by the sum of weights of edge, corner and diagonal
+patterns, seen from the side to move, plus a bias. Each pattern instance
+is read as a base-3 number (empty 0, own 1, opponent 2) and looks up one
+weight table shared by its 8 symmetric placements. A shape which maps onto
+itself is read in each of its orders, so that the placements are closed
+under the symmetries and the 8 symmetric copies of a position get the same
+score for any weights. Weights are learned per game phase, bucketed by the
+number of disks.
+
+Train
+----------
+python -m strategy.pattern --games 4000 --rounds 3 --output strategy/pattern.npz
+"""
+
+import argparse
+import os
+import random
+import time
+
+import numpy as np
+
+from bitboard import BOARD_SIZE, flip_mask, iterate_bits, legal_moves, popcount
+
+# Canonical squares (row, column) of each pattern shape.
+SHAPES = (
+    ("edge2x", tuple((1, column) for column in range(1, 9)) + ((2, 2), (2, 7))),
+    ("corner3x3", tuple((row, column) for row in range(1, 4) for column in range(1, 4))),
+    ("corner2x5", tuple((row, column) for row in range(1, 3) for column in range(1, 6))),
+    ("hv2", tuple((2, column) for column in range(1, 9))),
+    ("hv3", tuple((3, column) for column in range(1, 9))),
+    ("hv4", tuple((4, column) for column in range(1, 9))),
+    ("diag8", tuple((index, index) for index in range(1, 9))),
+    ("diag7", tuple((index, index + 1) for index in range(1, 8))),
+    ("diag6", tuple((index, index + 2) for index in range(1, 7))),
+    ("diag5", tuple((index, index + 3) for index in range(1, 6))),
+    ("diag4", tuple((index, index + 4) for index in range(1, 5))),
+)
+PHASES = 6
+DEFAULT_WEIGHTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pattern.npz")
+
+# Scaled (weights, bias) by (path, modification time), shared by every PatternEvaluation of the process.
+_LOADED = {}
+
+
+def _symmetric(square:tuple, symmetry:int):
+    row, column = square
+    if symmetry & 1:
+        column = 9 - column
+    if symmetry & 2:
+        row = 9 - row
+    if symmetry & 4:
+        row, column = column, row
+    return row, column
+
+
+def _instances():
+    """Placements of every shape under the 8 symmetries.
+    Placements reading the same squares in the same order are kept once,
+    and the same squares in another order are kept as another instance.
+
+    Returns
+    ----------
+    squares : np.ndarray
+        (instances, 10) indices into the raveled padded board.
+    powers : np.ndarray
+        (instances, 10) base-3 place values, 0 where a shape is shorter.
+    offsets : np.ndarray
+        (instances,) start of the weight table of each instance.
+    size : int
+        Number of weights of all tables.
+    """
+    width = max(len(squares) for _, squares in SHAPES)
+    squares, powers, offsets = [], [], []
+    size = 0
+    for _, shape in SHAPES:
+        seen = set()
+        for symmetry in range(8):
+            placed = tuple(_symmetric(square, symmetry) for square in shape)
+            if placed in seen:
+                continue
+            seen.add(placed)
+            padding = width - len(placed)
+            squares.append([row*(BOARD_SIZE + 2) + column for row, column in placed] + [0]*padding)
+            powers.append([3**index for index in range(len(placed))] + [0]*padding)
+            offsets.append(size)
+        size += 3**len(shape)
+    return np.array(squares), np.array(powers), np.array(offsets), size
+
+
+SQUARES, POWERS, OFFSETS, SIZE = _instances()
+
+
+def _closed():
+    """Return wheather each symmetric copy of an instance is an instance of the same table.
+    Then the 8 symmetric copies of a position get the same score for any weights.
+    """
+    instances = {(offset, tuple(squares[powers > 0])) for squares, powers, offset in zip(SQUARES, POWERS, OFFSETS)}
+    for offset, squares in instances:
+        for symmetry in range(8):
+            placed = tuple(
+                row*(BOARD_SIZE + 2) + column
+                for row, column in (_symmetric(divmod(square, BOARD_SIZE + 2), symmetry) for square in squares)
+                )
+            if (offset, placed) not in instances:
+                return False
+    return True
+
+
+SYMMETRIC = _closed()
+
+
+def _swapped():
+    """Weight index of each weight index with own and opponent disks exchanged."""
+    swapped = []
+    for _, shape in SHAPES:
+        values = np.arange(3**len(shape))
+        index = np.zeros_like(values)
+        for place in range(len(shape)):
+            index += np.array([0, 2, 1])[values//3**place % 3]*3**place
+        swapped.append(index + sum(len(table) for table in swapped))
+    return np.concatenate(swapped)
+
+
+SWAPPED = _swapped()
+
+
+def phase_of(disks:int):
+    """Phase bucket of a position with the number of disks on board."""
+    return min(PHASES - 1, (disks - 4)*PHASES//(BOARD_SIZE*BOARD_SIZE - 3))
+
+
+def pattern_indices(boards):
+    """Weight indices of relative boards.
+
+    boards : np.ndarray
+        (..., 100) raveled padded boards with 1 for the side to move and -1 for the opponent.
+
+    Returns
+    ----------
+    indices : np.ndarray
+        (..., instances)
+    """
+    return _indices(boards[..., SQUARES])
+
+
+def _indices(states):
+    """Weight indices of the states of pattern squares."""
+    return ((states % 3)*POWERS).sum(axis=-1) + OFFSETS
+
+
+def bit_indices(players, opponents, chunk=2**14):
+    """Weight indices of bitboard arrays seen from players, computed in chunks to bound memory.
+
+    Returns
+    ----------
+    indices : np.ndarray
+        (positions, instances) of int32.
+    """
+    indices = np.empty((len(players), len(SQUARES)), dtype=np.int32)
+    for start in range(0, len(players), chunk):
+        boards = relative_boards(players[start:start + chunk], opponents[start:start + chunk])
+        indices[start:start + chunk] = pattern_indices(boards)
+    return indices
+
+
+def relative_boards(players, opponents):
+    """Raveled padded boards of bitboard arrays, seen from players."""
+    players = np.asarray(players, dtype=np.uint64)
+    opponents = np.asarray(opponents, dtype=np.uint64)
+    own = np.unpackbits(players.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    other = np.unpackbits(opponents.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    boards = np.zeros((len(players), BOARD_SIZE + 2, BOARD_SIZE + 2), dtype=np.int64)
+    boards[:, 1:-1, 1:-1] = (own.astype(np.int64) - other).reshape(-1, BOARD_SIZE, BOARD_SIZE)
+    return boards.reshape(len(players), -1)
+
+
+class PatternEvaluation:
+    """Evaluation by pattern weights read from a .npz file.
+
+    Evaluations are in hundredths of a disk, seen from game_turn.
+    """
+    SCALE = 100
+
+    def __init__(self, path=DEFAULT_WEIGHTS):
+        self._path = path
+        self._weights = None
+        self._bias = None
+        return
+
+    def load(self):
+        """Load weights on first use. Return False if the file is not available."""
+        if self._weights is not None:
+            return True
+        try:
+            key = (self._path, os.stat(self._path).st_mtime_ns)
+            if key not in _LOADED:
+                with np.load(self._path) as data:
+                    weights = data["weights"]
+                if weights.shape != (PHASES, SIZE + 1):
+                    return False
+                _LOADED[key] = (weights[:, :-1]*self.SCALE, weights[:, -1]*self.SCALE)
+        except (OSError, KeyError, ValueError):
+            return False
+        self._weights, self._bias = _LOADED[key]
+        return True
+
+    def evaluate(self, board, game_turn:int):
+        """Evaluate the padded board for game_turn."""
+        return self.evaluate_indices(_indices(board.take(SQUARES)*game_turn), np.count_nonzero(board[1:-1, 1:-1]))
+
+    def evaluate_indices(self, indices, disks:int):
+        """Evaluate weight indices of a position with the number of disks."""
+        phase = phase_of(disks)
+        return int(self._weights[phase].take(indices).sum() + self._bias[phase])
+
+    def evaluate_bits(self, players, opponents):
+        """Evaluate bitboard arrays seen from players, in disks."""
+        phases = np.array([phase_of(popcount(int(p) | int(o))) for p, o in zip(players, opponents)])
+        indices = bit_indices(np.asarray(players, dtype=np.uint64), np.asarray(opponents, dtype=np.uint64))
+        return (self._weights[phases[:, None], indices].sum(axis=1) + self._bias[phases])/self.SCALE
+
+
+def play_games(games:int, evaluation=None, epsilon=0.1, solve_empties=8, seed=0):
+    """Self-play positions labelled with the disk differential.
+
+    Moves are random without evaluation, otherwise greedy on the evaluation
+    with probability 1 - epsilon. At solve_empties empties the game is
+    solved exactly and every earlier position is labelled with the result.
+
+    Returns
+    ----------
+    players, opponents, labels : np.ndarray
+        Positions seen from the side to move and their labels.
+    """
+    from .endgame import EndgameSolver
+
+    rand = random.Random(seed)
+    solver = EndgameSolver()
+    players, opponents, labels = [], [], []
+    for _ in range(games):
+        player, opponent = 0x0000000810000000, 0x0000001008000000
+        sides = []
+        side = 1
+        passed = False
+        while True:
+            moves = legal_moves(player, opponent)
+            if not moves:
+                if passed or not legal_moves(opponent, player):
+                    result = popcount(player) - popcount(opponent)
+                    break
+                player, opponent, side, passed = opponent, player, -side, True
+                continue
+            passed = False
+            sides.append((player, opponent, side))
+            if BOARD_SIZE*BOARD_SIZE - popcount(player | opponent) <= solve_empties:
+                result = solver.solve_bits(player, opponent)[0]
+                break
+
+            candidates = list(iterate_bits(moves))
+            children = []
+            for bit in candidates:
+                flipped = flip_mask(player, opponent, bit)
+                children.append((opponent ^ flipped, player | flipped | (1 << bit)))
+            if evaluation is None or rand.random() < epsilon:
+                index = rand.randrange(len(candidates))
+            else:
+                scores = evaluation.evaluate_bits([child[0] for child in children], [child[1] for child in children])
+                index = int(np.argmin(scores))
+            player, opponent = children[index]
+            side = -side
+
+        for position_player, position_opponent, position_side in sides:
+            players.append(position_player)
+            opponents.append(position_opponent)
+            labels.append(result if position_side == side else -result)
+    return np.array(players, dtype=np.uint64), np.array(opponents, dtype=np.uint64), np.array(labels, dtype=float)
+
+
+def fit(players, opponents, labels, regularization=1.0, iterations=200):
+    """Fit weights of every phase by ridge least squares.
+
+    The normal equations are solved by conjugate gradient, where the sparse
+    design matrix is applied with np.take and np.bincount.
+
+    Returns
+    ----------
+    weights : np.ndarray
+        (PHASES, SIZE + 1) with the bias in the last column.
+    """
+    indices = bit_indices(players, opponents)
+    # The bias is one more feature present in every position.
+    indices = np.concatenate([indices, np.full((len(indices), 1), SIZE, dtype=np.int32)], axis=1)
+    phases = np.array([phase_of(popcount(int(p) | int(o))) for p, o in zip(players, opponents)])
+
+    weights = np.zeros((PHASES, SIZE + 1))
+    for phase in range(PHASES):
+        rows = indices[phases == phase]
+        target = labels[phases == phase]
+        if not len(rows):
+            continue
+        flat = rows.ravel()
+
+        def normal(vector):
+            residual = vector.take(rows).sum(axis=1)
+            return np.bincount(flat, weights=np.repeat(residual, rows.shape[1]), minlength=SIZE + 1) + regularization*vector
+
+        solution = np.zeros(SIZE + 1)
+        residual = np.bincount(flat, weights=np.repeat(target, rows.shape[1]), minlength=SIZE + 1)
+        direction = residual.copy()
+        norm = residual @ residual
+        for _ in range(iterations):
+            product = normal(direction)
+            step = norm/(direction @ product)
+            solution += step*direction
+            residual -= step*product
+            next_norm = residual @ residual
+            if next_norm < 1e-10:
+                break
+            direction = residual + next_norm/norm*direction
+            norm = next_norm
+        weights[phase] = solution
+    return weights
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=4000, help="self-play games per round")
+    parser.add_argument("--rounds", type=int, default=2, help="rounds after the first use the previous weights")
+    parser.add_argument("--epsilon", type=float, default=0.1)
+    parser.add_argument("--solve-empties", type=int, default=8)
+    parser.add_argument("--regularization", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_WEIGHTS)
+    args = parser.parse_args()
+
+    evaluation = None
+    data = [[], [], []]
+    for round_ in range(args.rounds):
+        start = time.perf_counter()
+        for column, array in zip(data, play_games(args.games, evaluation, args.epsilon, args.solve_empties, args.seed + round_)):
+            column.append(array)
+        players, opponents, labels = (np.concatenate(column) for column in data)
+        weights = fit(players, opponents, labels, args.regularization)
+        temporary = args.output + ".tmp.npz"
+        np.savez_compressed(temporary, weights=weights.astype(np.float32))
+        os.replace(temporary, args.output)
+        evaluation = PatternEvaluation(args.output)
+        evaluation.load()
+        predicted = evaluation.evaluate_bits(players, opponents)
+        print("round {}: {} positions, rms error {:.2f} disks, {:.1f} s".format(
+            round_, len(labels), float(np.sqrt(np.mean((predicted - labels)**2))), time.perf_counter() - start))
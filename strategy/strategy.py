@@ -1,20 +1,30 @@
 """Various strategies for othello.
 """
 
-from collections import deque
-import copy
-import numpy as np
-import random
+import importlib
 
-import othello
 from othello import OthelloGame
 
-from .evenness import Evenness
-from .maximize import Maximize
-from .minimize import Minimize
-from .minmax import Minmax
-from .openness import Openness
-from .random import Random
+# name: (module, class, keyword arguments). Modules are imported on first use.
+REGISTRY = {
+    "random": (".random", "Random", {}),
+    "maximize": (".maximize", "Maximize", {}),
+    "minimize": (".minimize", "Minimize", {}),
+    "openness_theory": (".openness", "Openness", {}),
+    "evenness_theory": (".evenness", "Evenness", {}),
+    "min-max": (".minmax", "Minmax", {}),
+    "min-max-matrix": (".minmax", "Minmax", {"evaluation": "matrix"}),
+}
+
+
+def load_engine(strategy:str):
+    """Build a new engine of strategy, importing its module on first use.
+    Engines share only read-only data such as pattern weights and the book map.
+    """
+    module, name, options = REGISTRY[strategy]
+    Engine = getattr(importlib.import_module(module, __package__), name)
+    return Engine(**options)
+
 
 class Strategy(OthelloGame):
     """You can select AI strategy from candidates below.
@@ -26,28 +36,54 @@ class Strategy(OthelloGame):
     minimize : Put disk to minimize number of one's disks.
     openness : Put disk based on openness theory.
     evenness : Put disk based on evenness theory.
+    min-max : Find a better move by min-max method.
+    min-max-matrix : min-max with the static weight matrices instead of patterns.
     """
     
     def __init__(self, othello):
         self._othello = othello
         self._player_color = othello._player_color
-        self._strategy = Random()
+        # Engines of this strategy, so that tables and time limits are not shared with the other side.
+        self._engines = {}
+        self._strategy = self.engine("random")
         return
 
-    def set_strategy(self, strategy:str):
-        if strategy == "random":
-            self._strategy = Random()
-        if strategy == "maximize":
-            self._strategy = Maximize()
-        if strategy == "minimize":
-            self._strategy = Minimize()
-        if strategy == "openness_theory":
-            self._strategy = Openness()
-        if strategy == "evenness_theory":
-            self._strategy = Evenness()
-        if strategy == "min-max":
-            self._strategy = Minmax()
+    def engine(self, strategy:str):
+        """Return the engine of strategy, built on first selection."""
+        if strategy not in self._engines:
+            self._engines[strategy] = load_engine(strategy)
+        return self._engines[strategy]
+
+    def set_strategy(self, strategy:str, time_limit=None):
+        """Set a strategy.
+
+        time_limit : float or None
+            Time budget per move in seconds for min-max.
+            If None, min-max searches to a fixed depth.
+        """
+        if strategy not in REGISTRY:
+            return
+        self._strategy = self.engine(strategy)
+        if hasattr(self._strategy, "set_time_limit"):
+            self._strategy.set_time_limit(time_limit)
         return
 
     def selecter(self, othello):
-        return self._strategy.put_disk(othello)
\ No newline at end of file
+        return self._strategy.put_disk(othello)
+
+    def cancel(self):
+        """Stop a running selection if the strategy supports it."""
+        if hasattr(self._strategy, "cancel"):
+            self._strategy.cancel()
+        return
+
+    def clear_cancel(self):
+        if hasattr(self._strategy, "clear_cancel"):
+            self._strategy.clear_cancel()
+        return
+
+    def progress(self):
+        """Return progress of a running selection, or an empty dict."""
+        if hasattr(self._strategy, "progress"):
+            return self._strategy.progress()
+        return {}
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""Zobrist hashing and transposition table for search strategies.
+"""
+
+import random
+
+from bitboard import INVERSE_BIT, SYMMETRIES, TRANSFORM_BIT, bit_to_square
+from othello import OthelloGame
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# A symmetric key holds one 64-bit lane per symmetry; lane s is the key of the transformed board.
+LANE = 64
+LANE_MASK = (1 << LANE) - 1
+LANE_SHIFTS = tuple(LANE*symmetry for symmetry in range(SYMMETRIES))
+# TRANSFORM_SQUARE[symmetry][(row, column)] is the square after the symmetry, INVERSE_SQUARE maps it back.
+TRANSFORM_SQUARE = tuple(
+    {bit_to_square(bit): bit_to_square(table[bit]) for bit in range(len(table))} for table in TRANSFORM_BIT
+)
+INVERSE_SQUARE = tuple(
+    {bit_to_square(bit): bit_to_square(table[bit]) for bit in range(len(table))} for table in INVERSE_BIT
+)
+
+
+def canonical_key(key:int):
+    """Return the minimal lane of a symmetric key and its symmetry.
+    A plain 64-bit key is its own canonical key.
+    """
+    if not key >> LANE:
+        return key, 0
+    lanes = [(key >> shift) & LANE_MASK for shift in LANE_SHIFTS]
+    canonical = min(lanes)
+    return canonical, lanes.index(canonical)
+
+
+class Zobrist:
+    """64-bit Zobrist keys of the padded board.
+
+    A key is the XOR of one random number per occupied square and color,
+    plus TURN when white is to move, so that it can be updated per move.
+
+    symmetric : bool
+        If True, keys carry one lane per symmetry of the board, so that
+        tables keyed by canonical_key() share entries between rotated
+        and reflected copies of a position. Keys are updated the same way.
+    """
+
+    def __init__(self, seed=20210512, symmetric=False):
+        rand = random.Random(seed)
+        size = OthelloGame.BOARD_SIZE + 2
+        self._piece = {
+            color: [[rand.getrandbits(64) for _ in range(size)] for _ in range(size)]
+            for color in (OthelloGame.BLACK, OthelloGame.WHITE)
+        }
+        # XOR of both colors, used to reverse a disk in one operation.
+        self._flip = [
+            [self._piece[OthelloGame.BLACK][row][column] ^ self._piece[OthelloGame.WHITE][row][column] for column in range(size)]
+            for row in range(size)
+        ]
+        self.TURN = rand.getrandbits(64)
+        if symmetric:
+            self._piece = {color: self._lanes(piece) for color, piece in self._piece.items()}
+            self._flip = self._lanes(self._flip)
+            self.TURN = sum(self.TURN << shift for shift in LANE_SHIFTS)
+        return
+
+    @staticmethod
+    def _lanes(numbers):
+        """Put in lane s of each square the number of the square that symmetry s moves it to."""
+        lanes = [row[:] for row in numbers]
+        for row, column in TRANSFORM_SQUARE[0]:
+            lanes[row][column] = 0
+            for table, shift in zip(TRANSFORM_SQUARE, LANE_SHIFTS):
+                x, y = table[(row, column)]
+                lanes[row][column] |= numbers[x][y] << shift
+        return lanes
+
+    def hashing(self, board, game_turn:int):
+        """Calculate a key of a board from scratch."""
+        key = 0
+        for row in range(1, OthelloGame.BOARD_SIZE+1):
+            for column in range(1, OthelloGame.BOARD_SIZE+1):
+                color = board[row, column]
+                if color == OthelloGame.BLACK or color == OthelloGame.WHITE:
+                    key ^= self._piece[color][row][column]
+        if game_turn == OthelloGame.WHITE:
+            key ^= self.TURN
+        return key
+
+    def update(self, key:int, row:int, column:int, reversed_disks:list, game_turn:int):
+        """Return the key after game_turn puts a disk on (row, column).
+        The side to move is changed as well.
+        """
+        key ^= self._piece[game_turn][row][column] ^ self.TURN
+        for x, y in reversed_disks:
+            key ^= self._flip[x][y]
+        return key
+
+
+class TranspositionTable:
+    """Fixed-size transposition table.
+
+    Each slot keeps one entry (key, depth, bound, evaluation, selected, age).
+    An entry is replaced when it belongs to an older search or
+    when the new entry was searched at least as deep.
+    """
+
+    def __init__(self, size=2**16):
+        self._size = size
+        self._entries = [None]*size
+        self._age = 0
+        self.reset_statistics()
+        return
+
+    def __len__(self):
+        return self._size
+
+    def new_search(self):
+        """Advance the age so that entries of previous searches become replaceable."""
+        self._age = (self._age + 1) & 0xFF
+        self.reset_statistics()
+        return
+
+    def reset_statistics(self):
+        self._probes = 0
+        self._hits = 0
+        self._collisions = 0
+        return
+
+    def probe(self, key:int):
+        """Return the stored entry of key, or None."""
+        self._probes += 1
+        entry = self._entries[key % self._size]
+        if entry is None:
+            return None
+        if entry[0] != key:
+            self._collisions += 1
+            return None
+        self._hits += 1
+        return entry
+
+    def lookup(self, key:int, depth:int, alpha:float, beta:float):
+        """Return (True, evaluation, selected) if the stored bound decides the window.
+        Otherwise return (False, None, selected), where selected is the stored best move or None.
+        Symmetric keys are looked up by their canonical key.
+        """
+        key, symmetry = canonical_key(key)
+        entry = self.probe(key)
+        if entry is None:
+            return False, None, None
+        _, stored_depth, bound, evaluation, selected, _ = entry
+        if selected is not None and symmetry:
+            selected = INVERSE_SQUARE[symmetry][selected]
+        if stored_depth >= depth:
+            if bound == EXACT:
+                return True, evaluation, selected
+            if bound == LOWER and evaluation >= beta:
+                return True, evaluation, selected
+            if bound == UPPER and evaluation <= alpha:
+                return True, evaluation, selected
+        return False, None, selected
+
+    def store(self, key:int, depth:int, bound:int, evaluation:float, selected):
+        """Store an entry according to the depth and age replacement policy.
+        Symmetric keys are stored by their canonical key, with the move in canonical orientation.
+        """
+        key, symmetry = canonical_key(key)
+        if selected is not None and symmetry:
+            selected = TRANSFORM_SQUARE[symmetry][selected]
+        index = key % self._size
+        entry = self._entries[index]
+        if entry is None or entry[0] == key or entry[5] != self._age or entry[1] <= depth:
+            self._entries[index] = (key, depth, bound, evaluation, selected, self._age)
+        return
+
+    def entries(self):
+        """Iterate stored entries (key, depth, bound, evaluation, selected, age)."""
+        return (entry for entry in self._entries if entry is not None)
+
+    def clear(self):
+        self._entries = [None]*self._size
+        self.reset_statistics()
+        return
+
+    def statistics(self):
+        """Return hit rate, collision count and occupancy of the current search."""
+        occupied = self._size - self._entries.count(None)
+        return {
+            "probes": self._probes,
+            "hits": self._hits,
+            "hit_rate": self._hits/self._probes if self._probes else 0.0,
+            "collisions": self._collisions,
+            "occupancy": occupied/self._size,
+        }
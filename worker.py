@@ -0,0 +1,114 @@
+"""Background search of moves.
+"""
+
+import threading
+import time
+
+
+class SearchWorker:
+    """Run a strategy's selection in a background thread.
+
+    The main thread starts a search and takes the result when it is told the
+    search finished, so that a long min-max search does not block the wx event loop.
+    A cancelled search is stopped and its result is discarded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self._strategy = None
+        self._generation = 0
+        self._done = False
+        self._result = None
+        self._error = None
+        self._start = time.perf_counter()
+        return
+
+    def start(self, strategy, othello, on_done=None):
+        """Start a search of strategy on a snapshot of othello.
+        on_done() is called from the search thread when a search which is not cancelled finished.
+        """
+        self.cancel()
+        if self._thread is not None:
+            self._thread.join()
+        strategy.clear_cancel()
+        with self._lock:
+            self._generation += 1
+            self._strategy = strategy
+            self._start = time.perf_counter()
+            self._thread = threading.Thread(
+                target=self._run, args=(strategy, othello.snapshot(), self._generation, on_done), daemon=True,
+                )
+        self._thread.start()
+        return
+
+    def _run(self, strategy, othello, generation:int, on_done):
+        try:
+            selected, error = strategy.selecter(othello), None
+        except Exception as exception:
+            selected, error = None, exception
+        with self._lock:
+            current = generation == self._generation
+            if current:
+                self._done = True
+                self._result = selected
+                self._error = error
+        if current and on_done is not None:
+            on_done()
+        return
+
+    def running(self):
+        """Return wheather a search which is not cancelled is running."""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive() and not self._done and self._strategy is not None
+
+    def done(self, strategy):
+        """Return wheather the search of strategy has a result."""
+        with self._lock:
+            return self._done and self._strategy is strategy
+
+    def poll(self):
+        """Return progress of the search.
+
+        Returns
+        ----------
+        progress : dict
+            running, done, elapsed and the strategy's own progress such as depth and nodes.
+        """
+        with self._lock:
+            strategy = self._strategy
+            progress = {
+                "running": self._thread is not None and self._thread.is_alive() and not self._done and strategy is not None,
+                "done": self._done,
+                "elapsed": time.perf_counter() - self._start,
+            }
+        if progress["running"]:
+            progress.update(strategy.progress())
+        return progress
+
+    def result(self):
+        """Take the result of the finished search.
+        An exception raised by the strategy is raised again here.
+        """
+        with self._lock:
+            selected, error = self._result, self._error
+            self._done = False
+            self._result = None
+            self._error = None
+            self._strategy = None
+        if error is not None:
+            raise error
+        return selected
+
+    def cancel(self):
+        """Cancel the running search. Its result will be discarded."""
+        with self._lock:
+            strategy = self._strategy
+            self._generation += 1
+            self._done = False
+            self._result = None
+            self._error = None
+            self._strategy = None
+        if strategy is not None:
+            strategy.cancel()
+        return